@@ -1,9 +1,18 @@
+import sys
+
+
 def main():
     from unimport.color import paint
     from unimport.enums import Color, Emoji
+    from unimport.exceptions import GitCommandError
     from unimport.main import Main
 
-    main = Main.run()
+    try:
+        main = Main.run()
+    except GitCommandError as exc:  # raised while listing the paths, e.g. for an unknown --changed-since ref
+        print(exc, file=sys.stderr)
+        raise SystemExit(1)
+
     if not main.is_unused_imports and main.config.check:
         print(
             paint(
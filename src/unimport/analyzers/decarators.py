@@ -1,10 +1,17 @@
+from __future__ import annotations
+
+import bisect
 import functools
 import re
+import tokenize
 from typing import cast
 
+from unimport import scanner
 from unimport import typing as T
 
-__all__ = ("generic_visit", "skip_import")
+__all__ = ("generic_visit", "get_skip_comment_lines", "skip_import")
+
+SKIP_IMPORT_COMMENTS_REGEX = re.compile("#.*(unimport: {0,1}skip|noqa)", re.IGNORECASE)
 
 
 def generic_visit(func: T.FunctionT) -> T.FunctionT:
@@ -16,14 +23,48 @@ def generic_visit(func: T.FunctionT) -> T.FunctionT:
     return cast(T.FunctionT, wrapper)
 
 
+def get_skip_comment_lines(source: str, tokens: list[tokenize.TokenInfo] | None = None) -> list[int]:
+    """Returns the sorted numbers of the lines that carry a skip comment.
+
+    The comments are found in the tokens of the source, so ``#`` characters
+    inside string literals are not taken for comments. Tokenizing is only
+    worth it when the text has a candidate comment, which few sources have,
+    and is skipped when the ``tokens`` are given.
+    """
+    if not SKIP_IMPORT_COMMENTS_REGEX.search(source):
+        return []
+
+    if tokens is None:
+        tokens = scanner.get_tokens(source)
+    if tokens is not None:
+        return [
+            token.start[0]
+            for token in tokens
+            if token.type == tokenize.COMMENT and SKIP_IMPORT_COMMENTS_REGEX.search(token.string)
+        ]
+
+    return [
+        lineno for lineno, line in enumerate(source.splitlines(), start=1) if SKIP_IMPORT_COMMENTS_REGEX.search(line)
+    ]
+
+
 def skip_import(func: T.FunctionT) -> T.FunctionT:
-    SKIP_IMPORT_COMMENTS_REGEX = "#.*(unimport: {0,1}skip|noqa)"
+    """Skips imports inside a ``try`` block and imports with a skip comment
+    on any of their lines; the comment lines are computed once per
+    analyzer, on its first import."""
 
     @functools.wraps(func)
     def wrapper(self, node, *args, **kwargs):
-        source_segment = "\n".join(self.source.splitlines()[node.lineno - 1 : node.end_lineno])
-        skip_comment = bool(re.search(SKIP_IMPORT_COMMENTS_REGEX, source_segment, re.IGNORECASE))
-        if not any((skip_comment, self.any_import_error)):
-            func(self, node, *args, **kwargs)
+        if self.any_import_error:
+            return
+
+        if self.skip_comment_lines is None:
+            self.skip_comment_lines = get_skip_comment_lines(self.source)
+
+        index = bisect.bisect_left(self.skip_comment_lines, node.lineno)
+        if index < len(self.skip_comment_lines) and self.skip_comment_lines[index] <= node.end_lineno:
+            return
+
+        func(self, node, *args, **kwargs)
 
     return cast(T.FunctionT, wrapper)
@@ -1,19 +1,19 @@
 from __future__ import annotations
 
 import ast
+import typing
 
 import unimport.constants as C
 import unimport.typing as T
+from unimport import utils
 from unimport.analyzers.decarators import generic_visit
-from unimport.analyzers.utils import first_parent_match
 
 __all__ = (
     "ImportableNameAnalyzer",
     "SuggestionNameAnalyzer",
+    "iget_importable_name",
 )
 
-from unimport.statement import Name, Scope
-
 
 class ImportableNameAnalyzer(ast.NodeVisitor):
     __slots__ = ("importable_nodes",)
@@ -53,19 +53,23 @@ class ImportableNameAnalyzer(ast.NodeVisitor):
 
 
 class SuggestionNameAnalyzer(ast.NodeVisitor):
-    __slots__ = ("suggestions_nodes",)
+    __slots__ = ("suggestions_nodes", "def_depth")
 
     def __init__(self) -> None:
         self.suggestions_nodes: list[T.ASTImportableT] = []  # nodes on the CFN
+        self.def_depth = 0  # number of classes and functions around the visited node
 
     def traverse(self, tree):
         self.visit(tree)
 
-    @generic_visit
     def visit_def(self, node: T.CFNT) -> None:
-        if not first_parent_match(node, C.DEF_TUPLE):
+        if not self.def_depth:
             self.suggestions_nodes.append(node)
 
+        self.def_depth += 1
+        self.generic_visit(node)
+        self.def_depth -= 1
+
     visit_ClassDef = visit_FunctionDef = visit_AsyncFunctionDef = visit_def
 
     @generic_visit
@@ -86,18 +90,30 @@ class SuggestionNameAnalyzer(ast.NodeVisitor):
                 self.suggestions_nodes.append(target)
 
 
-class ImportableNameWithScopeAnalyzer(ImportableNameAnalyzer):
-    def traverse(self, tree):
-        super().traverse(tree)
-
-        for node in self.importable_nodes:
-            Name.register(lineno=node.lineno, name=node.value, node=node, is_all=True)
-
-    def visit_def(self, node: T.CFNT) -> None:
-        Scope.add_current_scope(node)
-
-        self.generic_visit(node)
-
-        Scope.remove_current_scope()
-
-    visit_ClassDef = visit_FunctionDef = visit_AsyncFunctionDef = visit_def
+def iget_importable_name(package: str) -> typing.Iterator[str]:
+    """Yields the names a star import of the package makes available."""
+    if utils.is_std(package):
+        yield from utils.get_module_dir(package)
+
+    elif source := utils.get_source(package):
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            pass
+        else:
+            importable_name_analyzer = ImportableNameAnalyzer()
+            importable_name_analyzer.traverse(tree)
+            if importable_name_analyzer.importable_nodes:
+                for node in importable_name_analyzer.importable_nodes:
+                    if isinstance(node.value, str):
+                        yield node.value
+            else:
+                suggestion_name_analyzer = SuggestionNameAnalyzer()
+                suggestion_name_analyzer.traverse(tree)
+                for node in suggestion_name_analyzer.suggestions_nodes:  # type: ignore[assignment]
+                    if isinstance(node, ast.Name):
+                        yield node.id
+                    elif isinstance(node, ast.alias):
+                        yield node.asname or node.name
+                    elif isinstance(node, C.DEF_TUPLE):
+                        yield node.name
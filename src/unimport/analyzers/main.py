@@ -1,23 +1,36 @@
+from __future__ import annotations
+
 import ast
 import re
 from pathlib import Path
 
-from unimport.analyzers.import_statement import ImportAnalyzer
-from unimport.analyzers.importable import ImportableNameWithScopeAnalyzer
-from unimport.analyzers.name import NameAnalyzer
-from unimport.analyzers.utils import get_defined_names, set_tree_parents
-from unimport.statement import Import, ImportFrom, Name, Scope
+from unimport import scanner
+from unimport.analyzers.decarators import SKIP_IMPORT_COMMENTS_REGEX, get_skip_comment_lines
+from unimport.analyzers.tree import TreeAnalyzer
+from unimport.profiler import Profiler
+from unimport.statement import AnalysisSession, ImportFrom
 
 __all__ = ("MainAnalyzer",)
 
 
 class MainAnalyzer(ast.NodeVisitor):
-    __slots__ = ("source", "path", "include_star_import")
-
-    def __init__(self, *, source: str, path: Path = Path("<unknown file>"), include_star_import: bool = False):
+    __slots__ = ("source", "path", "include_star_import", "quick_reject", "is_clean", "session")
+
+    def __init__(
+        self,
+        *,
+        source: str,
+        path: Path = Path("<unknown file>"),
+        include_star_import: bool = False,
+        quick_reject: bool = False,
+        profiler: Profiler | None = None,
+    ):
         self.source = source
         self.path = path
         self.include_star_import = include_star_import
+        self.quick_reject = quick_reject  # see traverse
+        self.is_clean = False
+        self.session = AnalysisSession(profiler=profiler or Profiler())
 
     def __enter__(self):
         self.traverse()
@@ -27,35 +40,55 @@ class MainAnalyzer(ast.NodeVisitor):
         self.clear()
 
     def traverse(self) -> None:
+        """Analyzes the source.
+
+        With ``quick_reject``, sources that are tokenized anyway, to find
+        their skip comments, are not traversed when their tokens show no
+        unused import. Tokenizing costs more than the traversal it could
+        save, so other sources are not tokenized for it.
+        """
         if self.skip_file():
             return None
 
-        tree = ast.parse(self.source, type_comments=True)
+        profiler = self.session.profiler
 
-        set_tree_parents(tree)  # set parents to tree
+        with profiler.span("parse"):
+            tree = ast.parse(self.source, type_comments=True)
 
-        Scope.add_global_scope(tree)  # add global scope of the top tree
+        skip_comment_lines = None
+        if self.quick_reject and SKIP_IMPORT_COMMENTS_REGEX.search(self.source):
+            with profiler.span("quick reject"):
+                tokens = scanner.get_tokens(self.source)
+                self.is_clean = tokens is not None and scanner.is_clean(self.source, tokens)
+            if self.is_clean:
+                return None
+            skip_comment_lines = get_skip_comment_lines(self.source, tokens)
 
-        NameAnalyzer().traverse(tree)  # name analyzers
+        self.session.add_global_scope(tree)  # add global scope of the top tree
 
-        ImportableNameWithScopeAnalyzer().traverse(tree)  # importable analyzers for collect in __all__
-
-        ImportAnalyzer(  # import analyzers
-            source=self.source, include_star_import=self.include_star_import, defined_names=get_defined_names(tree)
-        ).traverse(tree)
+        with profiler.span("traverse"):
+            TreeAnalyzer(  # names, __all__ entries and imports
+                session=self.session,
+                source=self.source,
+                include_star_import=self.include_star_import,
+                skip_comment_lines=skip_comment_lines,
+            ).traverse(tree)
 
         self._deduplicate_star_suggestions()
         self._cleanup_empty_type_checking()
 
-        Scope.remove_current_scope()  # remove global scope
+        self.session.remove_current_scope()  # remove global scope
+
+        profiler.count(
+            names=len(self.session.names), scopes=len(self.session.scopes), imports=len(self.session.imports)
+        )
 
     def skip_file(self) -> bool:
         SKIP_FILE_REGEX = "#.*(unimport: {0,1}skip_file)"
 
         return bool(re.search(SKIP_FILE_REGEX, self.source, re.IGNORECASE))
 
-    @staticmethod
-    def _deduplicate_star_suggestions() -> None:
+    def _deduplicate_star_suggestions(self) -> None:
         """Remove duplicate suggestions across star and explicit imports.
 
         When multiple imports provide the same name, the last one wins
@@ -63,21 +96,20 @@ class MainAnalyzer(ast.NodeVisitor):
         claim their name so star imports don't produce duplicates.
         """
         seen: set[str] = set()
-        for imp in reversed(Import.imports):
+        for imp in reversed(self.session.imports):
             if isinstance(imp, ImportFrom) and imp.star:
                 imp.suggestions = [s for s in imp.suggestions if s not in seen]
                 seen.update(imp.suggestions)
             else:
                 seen.add(imp.name)
 
-    @staticmethod
-    def _cleanup_empty_type_checking() -> None:
+    def _cleanup_empty_type_checking(self) -> None:
         """If all TYPE_CHECKING-guarded imports are unused, mark TYPE_CHECKING import as unused.
 
         Removes TYPE_CHECKING Name references so the import becomes unused,
         enabling removal of both the import and the empty if-block.
         """
-        tc_imports = [imp for imp in Import.imports if imp.is_type_checking]
+        tc_imports = [imp for imp in self.session.imports if imp.is_type_checking]
         if not tc_imports:
             return
 
@@ -85,18 +117,10 @@ class MainAnalyzer(ast.NodeVisitor):
             return
 
         names_to_remove = [
-            name for name in Name.names if name.name == "TYPE_CHECKING" or name.name.endswith(".TYPE_CHECKING")
+            name for name in self.session.names if name.name == "TYPE_CHECKING" or name.name.endswith(".TYPE_CHECKING")
         ]
         for name in names_to_remove:
-            Name.names.remove(name)
-            for scope in Scope.scopes:
-                if name in scope.current_nodes:
-                    scope.current_nodes.remove(name)
-                    break
-
-    @staticmethod
-    def clear():
-        Name.clear()
-        Import.clear()
-        ImportFrom.clear()
-        Scope.clear()
+            self.session.remove_name(name)
+
+    def clear(self) -> None:
+        self.session.clear()
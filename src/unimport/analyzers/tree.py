@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+import ast
+import functools
+import typing
+
+from unimport import constants as C
+from unimport import typing as T
+from unimport.analyzers.decarators import skip_import
+from unimport.analyzers.importable import iget_importable_name
+from unimport.statement import AnalysisSession, Import, ImportFrom, Name, NameTable
+
+__all__ = ("TreeAnalyzer", "parse_string")
+
+
+@functools.lru_cache(maxsize=C.PARSED_STRING_CACHE_SIZE)
+def parse_string(value: str, mode: str = "eval") -> ast.AST | None:
+    """Parses a string annotation or type comment, or returns ``None`` for
+    invalid syntax.
+
+    Codebases repeat the same annotations many times, so trees are shared
+    across analyses and must not be modified; positions are taken from the
+    node the string was found on instead.
+    """
+    try:
+        return ast.parse(value, mode=mode, type_comments=True)
+    except SyntaxError:
+        return None
+
+
+class TreeAnalyzer(ast.NodeVisitor):
+    """Collects the names, ``__all__`` entries, defined names and imports of
+    a tree in a single traversal.
+
+    The nodes above the visited one are kept on stacks, so the parent and
+    the nearest enclosing annotated node or function are known without
+    writing a ``parent`` attribute onto the tree.
+
+    Names are kept in a ``NameTable`` during the traversal and registered
+    once it is over, only those whose first component is bound by an
+    import, as no other name can match one; ``__all__`` entries and
+    ``TYPE_CHECKING`` references are always registered. Star import
+    suggestions are resolved last, from every name of the tree.
+    """
+
+    __slots__ = (
+        "session",
+        "source",
+        "include_star_import",
+        "defined_names",
+        "names",
+        "import_heads",
+        "all_nodes",
+        "star_imports",
+        "any_import_error",
+        "skip_comment_lines",
+        "if_names",
+        "orelse_names",
+        "_in_type_checking",
+        "_string_lineno",
+        "_ancestors",
+        "_annotated",
+        "_functions",
+    )
+
+    IGNORE_MODULES_IMPORTS = ("__future__",)
+    IGNORE_IMPORT_NAMES = ("__all__", "__doc__", "__name__")
+
+    def __init__(
+        self,
+        *,
+        session: AnalysisSession,
+        source: str,
+        include_star_import: bool = False,
+        skip_comment_lines: list[int] | None = None,
+    ) -> None:
+        self.session = session
+        self.source = source
+        self.include_star_import = include_star_import
+
+        self.defined_names: set[str] = set()
+        self.names = NameTable()  # every name, with its line and scope
+        self.import_heads: set[str] = set()  # first components of the imported names
+        self.all_nodes: list[ast.Constant] = []  # nodes on the __all__ list
+        self.star_imports: list[ImportFrom] = []
+
+        self.any_import_error = False
+        self.skip_comment_lines = skip_comment_lines  # see skip_import
+
+        self.if_names: set[str] = set()
+        self.orelse_names: set[str] = set()
+        self._in_type_checking: bool = False
+        self._string_lineno: int | None = None  # line of the string annotation or type comment being visited
+
+        self._ancestors: list[ast.AST] = []
+        self._annotated: list[ast.AnnAssign | ast.arg] = []  # enclosing nodes that can have an annotation
+        self._functions: list[ast.FunctionDef | ast.AsyncFunctionDef] = []
+
+    def traverse(self, tree: ast.AST) -> None:
+        self.visit(tree)
+
+        # Whether a name can match an import is decided once per distinct name.
+        symbol_ids = {
+            symbol_id
+            for symbol_id, name in enumerate(self.names.symbols)
+            if (
+                name.partition(".")[0] in self.import_heads
+                or name == "TYPE_CHECKING"
+                or name.endswith(".TYPE_CHECKING")
+            )
+        }
+        for lineno, name, scope in self.names.rows(symbol_ids):
+            Name.register(self.session, lineno=lineno, name=name, scope=scope)
+
+        for node in self.all_nodes:
+            Name.register(self.session, lineno=node.lineno, name=typing.cast(str, node.value), is_all=True)
+
+        for star_import in self.star_imports:
+            star_import.suggestions = self.get_suggestions(star_import.package)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        self._ancestors.append(node)
+        for child in ast.iter_child_nodes(node):
+            self.visit(child)
+        self._ancestors.pop()
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.defined_names.add(node.name)
+        self.session.add_current_scope(node)
+
+        self.generic_visit(node)
+
+        self.session.remove_current_scope()
+
+    def visit_FunctionDef(self, node: T.ASTFunctionT) -> None:
+        self.defined_names.add(node.name)
+        self.session.add_current_scope(node)
+
+        if node.type_comment is not None:
+            self.join_visit(node.type_comment, node, mode="func_type")
+
+        self._functions.append(node)
+        self.generic_visit(node)
+        self._functions.pop()
+
+        self.session.remove_current_scope()
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        if isinstance(node.value, str):
+            if self._annotated and isinstance(self._annotated[-1].annotation, ast.Constant):
+                self.join_visit(node.value, node)
+            elif self._functions and self._functions[-1].returns is node:
+                self.join_visit(node.value, node)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        self._annotated.append(node)
+        self.generic_visit(node)
+        self._annotated.pop()
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if not isinstance(self._ancestors[-1], ast.Attribute):
+            lineno = node.lineno if self._string_lineno is None else self._string_lineno
+            self.names.add(lineno, node.id, self.session.current_scope[-1])
+
+        if isinstance(node.ctx, ast.Store) and self._string_lineno is None:
+            self.defined_names.add(node.id)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        """Registers the dotted names of an attribute chain, outermost first,
+        in a single descent from its outermost node; the inner attributes
+        are not visited again.
+
+        ``a.b.c`` registers ``a.b.c`` and ``a.b``, so ``import a.b`` and
+        ``import a.b.c`` are both used by it. A chain that does not start
+        with a name, such as a call or a subscript, registers nothing
+        itself and its start is visited.
+        """
+        chain = [node]
+        value = node.value
+        while isinstance(value, ast.Attribute):
+            chain.append(value)
+            value = value.value
+
+        if isinstance(value, ast.Name):
+            names = []
+            name = value.id
+            for attribute in reversed(chain):
+                name = f"{name}.{attribute.attr}"
+                names.append(name)
+
+            scope = self.session.current_scope[-1]
+            for attribute, name in zip(chain, reversed(names)):
+                lineno = attribute.lineno if self._string_lineno is None else self._string_lineno
+                self.names.add(lineno, name, scope)
+        else:
+            self._ancestors.extend(chain)
+            self.visit(value)
+            del self._ancestors[-len(chain) :]
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        if node.type_comment is not None:
+            self.join_visit(node.type_comment, node)
+
+        if getattr(node.targets[0], "id", None) == "__all__" and isinstance(node.value, (ast.List, ast.Tuple, ast.Set)):
+            for item in node.value.elts:
+                if isinstance(item, ast.Constant) and isinstance(item.value, str):
+                    self.all_nodes.append(item)
+
+        self.generic_visit(node)
+
+    def visit_Expr(self, node: ast.Expr) -> None:
+        if (
+            isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Attribute)
+            and isinstance(node.value.func.value, ast.Name)
+            and node.value.func.value.id == "__all__"
+        ):
+            if node.value.func.attr == "append":
+                for arg in node.value.args:
+                    if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                        self.all_nodes.append(arg)
+
+            elif node.value.func.attr == "extend":
+                for arg in node.value.args:
+                    if isinstance(arg, ast.List):
+                        for item in arg.elts:
+                            if isinstance(item, ast.Constant) and isinstance(item.value, str):
+                                self.all_nodes.append(item)
+
+        self.generic_visit(node)
+
+    def visit_arg(self, node: ast.arg) -> None:
+        if node.type_comment is not None:
+            self.join_visit(node.type_comment, node)
+
+        self._annotated.append(node)
+        self.generic_visit(node)
+        self._annotated.pop()
+
+    def visit_Subscript(self, node: ast.Subscript) -> None:
+        if (
+            isinstance(node.value, ast.Attribute)
+            and isinstance(node.value.value, ast.Name)
+            and node.value.value.id == "typing"
+        ) or (isinstance(node.value, ast.Name) and node.value.id in C.SUBSCRIPT_TYPE_VARIABLE):
+            _slice = node.slice
+            if isinstance(_slice, ast.Tuple):
+                for elt in _slice.elts:
+                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
+                        self.join_visit(elt.value, elt)
+            else:
+                if isinstance(_slice, ast.Constant) and isinstance(_slice.value, str):
+                    self.join_visit(_slice.value, _slice)
+
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        if (
+            (
+                isinstance(node.func, ast.Attribute)
+                and isinstance(node.func.value, ast.Name)
+                and node.func.value.id == "typing"
+                and node.func.attr == "cast"
+            )
+            or isinstance(node.func, ast.Name)
+            and node.func.id == "cast"
+        ):
+            if isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str):
+                self.join_visit(node.args[0].value, node.args[0])
+
+        self.generic_visit(node)
+
+    @skip_import
+    def visit_Import(self, node: ast.Import) -> None:
+        for column, alias in enumerate(node.names):
+            name = alias.asname or alias.name
+            if name in self.IGNORE_IMPORT_NAMES or (name in self.if_names and name in self.orelse_names):
+                continue
+
+            Import.register(
+                self.session,
+                lineno=node.lineno,
+                column=column + 1,
+                name=name,
+                package=alias.name,
+                is_type_checking=self._in_type_checking,
+            )
+            self.import_heads.add(name.partition(".")[0])
+
+    @skip_import
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        is_star = node.names[0].name == "*"
+
+        for column, alias in enumerate(node.names):
+            package = node.module if not node.level else "." * node.level + str(node.module) or ""
+            if (package in self.IGNORE_MODULES_IMPORTS) or (is_star and not self.include_star_import):
+                return
+
+            name = package if is_star else (alias.asname or alias.name)
+            if name in self.IGNORE_IMPORT_NAMES or (name in self.if_names and name in self.orelse_names):
+                continue
+
+            _import = ImportFrom.register(
+                self.session,
+                lineno=node.lineno,
+                column=column + 1,
+                name=name,
+                package=package,
+                star=is_star,
+                suggestions=[],
+                is_type_checking=self._in_type_checking,
+            )
+            self.import_heads.add(name.partition(".")[0])
+            if is_star:
+                self.star_imports.append(_import)
+
+    @staticmethod
+    def _is_type_checking_block(if_node: ast.If) -> bool:
+        test = if_node.test
+        if isinstance(test, ast.Name) and test.id == "TYPE_CHECKING":
+            return True
+        if isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING":
+            return True
+        return False
+
+    @staticmethod
+    def _collect_import_names(nodes: list[ast.stmt], *, recursive: bool = True) -> set[str]:
+        names: set[str] = set()
+        for node in nodes:
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                for alias in node.names:
+                    names.add(alias.asname or alias.name)
+            elif recursive and isinstance(node, ast.If):
+                names |= TreeAnalyzer._collect_import_names(node.body)
+                names |= TreeAnalyzer._collect_import_names(node.orelse)
+        return names
+
+    def visit_If(self, if_node: ast.If) -> None:
+        if self._is_type_checking_block(if_node):
+            self._ancestors.append(if_node)
+            self.visit(if_node.test)
+
+            self._in_type_checking = True
+            for node in if_node.body:
+                self.visit(node)
+            self._in_type_checking = False
+
+            for node in if_node.orelse:
+                self.visit(node)
+            self._ancestors.pop()
+            return
+
+        self.if_names = self._collect_import_names(if_node.body)
+
+        self.orelse_names = self._collect_import_names(if_node.orelse, recursive=False)
+
+        self.generic_visit(if_node)
+
+        self.if_names = set()
+        self.orelse_names = set()
+
+    def visit_Try(self, node: ast.Try) -> None:
+        self.any_import_error = True
+
+        self.generic_visit(node)
+
+        self.any_import_error = False
+
+    def join_visit(self, value: str, node: ast.AST, *, mode: str = "eval") -> None:
+        """A function that parses the value and includes it in self.visit,
+        in place of the node and at its line; nested strings keep the line
+        of the outermost one."""
+        tree = parse_string(value, mode)
+        if tree is None:
+            return
+
+        string_lineno = self._string_lineno
+        if string_lineno is None:
+            self._string_lineno = node.lineno  # type: ignore[attr-defined]
+        try:
+            self.visit(tree)
+        finally:
+            self._string_lineno = string_lineno
+
+    def get_suggestions(self, package: str) -> list[str]:
+        with self.session.profiler.span("star imports"):
+            names = {name.partition(".")[0] for name in self.names.symbols}
+            names.update(typing.cast(str, node.value).partition(".")[0] for node in self.all_nodes)
+            from_names = iget_importable_name(package)
+            return sorted(set(from_names) & (names - self.defined_names))
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import itertools
+import json
+import os
+import sys
+import tempfile
+import time
+import typing
+from pathlib import Path
+
+from unimport import __version__
+from unimport import constants as C
+from unimport.statement import Import, ImportFrom
+
+__all__ = ("Cache", "Manifest")
+
+
+def _write_atomic(path: Path, content: typing.Any) -> None:
+    """Writes JSON to a temporary file and renames it into place, so
+    concurrent readers and interrupted runs never see a partial file."""
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, mode="w", encoding="utf-8") as stream:
+                json.dump(content, stream)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+@dataclasses.dataclass
+class Cache:
+    """Content addressed, size bounded store of analysis results.
+
+    Entries are keyed by the source text, the configuration fields that
+    change the analysis, the unimport version and the interpreter
+    version, so a changed file or upgrade never reuses a stale result.
+    The least recently used entries are evicted once the directory grows
+    past ``max_size`` bytes.
+    """
+
+    # A temporary file older than this was left by a run that was killed
+    # before renaming it into place.
+    TEMP_FILE_GRACE_NS: typing.ClassVar[int] = 60 * 1_000_000_000
+
+    directory: Path
+    max_size: int = C.CACHE_MAX_SIZE
+
+    hits: int = dataclasses.field(init=False, default=0, compare=False)
+    misses: int = dataclasses.field(init=False, default=0, compare=False)
+    unread: int = dataclasses.field(init=False, default=0, compare=False)  # hits served by the manifest
+
+    @staticmethod
+    def key(source: str, **fields: typing.Any) -> str:
+        context = json.dumps([__version__, sys.version, sorted(fields.items())])
+        digest = hashlib.sha256(context.encode())
+        digest.update(source.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def get_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        path = self.get_path(key)
+        try:
+            content = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+        try:
+            entry = json.loads(content)
+        except ValueError:
+            with contextlib.suppress(OSError):
+                path.unlink()  # corrupt entry
+            return None
+
+        with contextlib.suppress(OSError):
+            os.utime(path)  # mark as recently used
+        return entry
+
+    def set(self, key: str, entry: dict) -> None:
+        _write_atomic(self.get_path(key), entry)
+
+    def get_manifest_path(self, **fields: typing.Any) -> Path:
+        return self.directory / f"manifest-{self.key('', **fields)[:16]}.json"
+
+    def evict(self) -> None:
+        """Removes the temporary files of interrupted writes, then the least
+        recently used entries and manifests until the cache fits in
+        ``max_size``."""
+        expired_ns = time.time_ns() - self.TEMP_FILE_GRACE_NS
+        with contextlib.suppress(OSError):
+            for path in itertools.chain(self.directory.glob("*/*.tmp"), self.directory.glob("*.tmp")):
+                with contextlib.suppress(OSError):
+                    if path.stat().st_mtime_ns < expired_ns:
+                        path.unlink()
+
+        entries = []
+        with contextlib.suppress(OSError):
+            for path in itertools.chain(self.directory.glob("*/*.json"), self.directory.glob("manifest-*.json")):
+                with contextlib.suppress(OSError):
+                    stat = path.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            with contextlib.suppress(OSError):
+                path.unlink()
+                size -= entry_size
+
+    @staticmethod
+    def dump_imports(imports: typing.Iterable[Import | ImportFrom]) -> list[dict]:
+        return [
+            {field.name: getattr(imp, field.name) for field in dataclasses.fields(imp) if field.init} for imp in imports
+        ]
+
+    @staticmethod
+    def load_imports(imports: list[dict]) -> list[Import | ImportFrom]:
+        return [ImportFrom(**imp) if "star" in imp else Import(**imp) for imp in imports]
+
+    def summary(self) -> str:
+        return f"Cache: {self.hits} hits ({self.unread} without reading the file), {self.misses} misses"
+
+
+@dataclasses.dataclass
+class Manifest:
+    """The last result of each file together with its ``stat`` data, so a
+    file whose size, mtime and inode did not change can be reported
+    without being opened."""
+
+    # A file modified shortly before it was read can change again without a
+    # visible mtime change on file systems with coarse timestamps; such
+    # entries are confirmed through the content hash.
+    RACY_WINDOW_NS: typing.ClassVar[int] = 1_000_000_000
+
+    path: Path
+    entries: dict[str, dict] = dataclasses.field(default_factory=dict, repr=False)
+    is_changed: bool = dataclasses.field(init=False, default=False, compare=False)
+
+    @classmethod
+    def load(cls, path: Path) -> Manifest:
+        try:
+            entries = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            entries = {}
+
+        return cls(path, entries if isinstance(entries, dict) else {})
+
+    @staticmethod
+    def get_stat(path: Path) -> list[int] | None:
+        """Returns the size, mtime and inode of the path followed by the time
+        they were read at."""
+        checked_ns = time.time_ns()
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        return [stat.st_size, stat.st_mtime_ns, stat.st_ino, checked_ns]
+
+    def get(self, path: Path, stat: list[int]) -> dict | None:
+        entry = self.entries.get(os.path.abspath(path), None)
+        if entry is None or entry["stat"][:3] != stat[:3]:
+            return None
+
+        # The file was read so soon after its last modification that a later
+        # write could have kept the same mtime.
+        if entry["stat"][3] - entry["stat"][1] < self.RACY_WINDOW_NS:
+            return None
+
+        return entry
+
+    def set(self, path: Path, stat: list[int], *, unused_imports: list[dict], syntax_error: str | None) -> None:
+        """Records the result of a file; ``stat`` must be taken before the file
+        was read."""
+        self.entries[os.path.abspath(path)] = {
+            "stat": stat,
+            "unused_imports": unused_imports,
+            "syntax_error": syntax_error,
+        }
+        self.is_changed = True
+
+    def save(self) -> None:
+        """Writes the manifest when an entry changed, dropping the entries of
+        files that no longer exist; otherwise only marks it as recently used,
+        as manifests count toward the size of the cache."""
+        if self.is_changed:
+            self.entries = {path: entry for path, entry in self.entries.items() if os.path.exists(path)}
+            _write_atomic(self.path, self.entries)
+            self.is_changed = False
+        else:
+            with contextlib.suppress(OSError):
+                os.utime(self.path)
@@ -18,11 +18,29 @@ __all__ = (
     "add_remove_option",
     "add_permission_option",
     "add_version_option",
+    "add_jobs_option",
+    "add_cache_dir_option",
+    "add_changed_since_option",
+    "add_git_files_option",
+    "add_files_from_option",
+    "add_profile_option",
+    "add_profile_slowest_option",
+    "add_trace_out_option",
 )
 
 from unimport.enums import ColorSelect
 
 
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+
 def add_sources_option(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "sources",
@@ -170,3 +188,86 @@ def add_color_option(parser: argparse.ArgumentParser) -> None:
         metavar="{" + ",".join(Config.get_color_choices()) + "}",
         help="Select whether to use color in the output. Defaults to `%(default)s`.",
     )
+
+
+def add_jobs_option(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        default=Config.jobs,
+        type=_positive_int,
+        metavar="N",
+        help="Number of files to analyze in parallel. Defaults to the number of usable CPUs.",
+    )
+
+
+def add_cache_dir_option(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--cache-dir",
+        default=Config.cache_dir,
+        help="Cache analysis results in PATH and reuse them for unchanged files.",
+        metavar="PATH",
+        action="store",
+        type=Path,
+    )
+
+
+def add_changed_since_option(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--changed-since",
+        default=Config.changed_since,
+        help="Only check Python files that changed since the git REF, including untracked files.",
+        metavar="REF",
+        action="store",
+        type=str,
+    )
+
+
+def add_git_files_option(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--git-files",
+        action="store_true",
+        help="List the files to check with git ls-files instead of walking the sources.",
+        default=Config.git_files,
+    )
+
+
+def add_files_from_option(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--files-from",
+        default=Config.files_from,
+        help="Check the newline or NUL separated paths in PATH, or stdin when PATH is -, instead of the sources.",
+        metavar="PATH",
+        action="store",
+        type=Path,
+    )
+
+
+def add_profile_option(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print the time spent in each phase and the slowest files to stderr.",
+        default=Config.profile,
+    )
+
+
+def add_profile_slowest_option(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile-slowest",
+        default=Config.profile_slowest,
+        type=_positive_int,
+        metavar="N",
+        help="Number of slowest files --profile reports. Defaults to %(default)s.",
+    )
+
+
+def add_trace_out_option(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--trace-out",
+        default=Config.trace_out,
+        help="Write a Chrome trace of the run to PATH, to open in a trace viewer such as Perfetto.",
+        metavar="PATH",
+        action="store",
+        type=Path,
+    )
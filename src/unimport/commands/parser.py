@@ -28,6 +28,14 @@ def generate_parser() -> argparse.ArgumentParser:
     options.add_diff_option(parser)
     options.add_remove_option(exclusive_group)
     options.add_permission_option(exclusive_group)
+    options.add_jobs_option(parser)
+    options.add_cache_dir_option(parser)
+    options.add_changed_since_option(parser)
+    options.add_git_files_option(parser)
+    options.add_files_from_option(parser)
+    options.add_profile_option(parser)
+    options.add_profile_slowest_option(parser)
+    options.add_trace_out_option(parser)
     options.add_version_option(parser)
 
     return parser
@@ -5,19 +5,26 @@ import configparser
 import contextlib
 import dataclasses
 import functools
+import os
+import re
 import sys
 import typing
 from ast import literal_eval
 from pathlib import Path
 
 import toml
-from pathspec.patterns import GitWildMatchPattern
 
 from unimport import constants as C
 from unimport import utils
 from unimport.color import TERMINAL_SUPPORT_COLOR
 from unimport.enums import ColorSelect
-from unimport.exceptions import ConfigFileNotFound, UnknownConfigKeyException, UnsupportedConfigFile
+from unimport.exceptions import (
+    ConfigFileNotFound,
+    GitCommandError,
+    UnknownConfigKeyException,
+    UnsupportedConfigFile,
+)
+from unimport.gitignore import Gitignore
 
 __all__ = ("Config", "ParseConfig")
 
@@ -39,22 +46,42 @@ CONFIG_ANNOTATIONS_MAPPING = {
     "check": bool,
     "ignore_init": bool,
     "color": str,
+    "jobs": int,
+    "cache_dir": Path,
+    "changed_since": str,
+    "git_files": bool,
+    "files_from": Path,
+    "profile": bool,
+    "profile_slowest": int,
+    "trace_out": Path,
     #
     "include-star-import": bool,
     "ignore-init": bool,
+    "cache-dir": Path,
+    "changed-since": str,
+    "git-files": bool,
+    "files-from": Path,
+    "profile-slowest": int,
+    "trace-out": Path,
 }
 
 CONFIG_LIKE_COMMANDS_MAPPING = {
     "include-star-import": "include_star_import",
     "ignore-init": "ignore_init",
+    "cache-dir": "cache_dir",
+    "changed-since": "changed_since",
+    "git-files": "git_files",
+    "files-from": "files_from",
+    "profile-slowest": "profile_slowest",
+    "trace-out": "trace_out",
 }
 
 
 @dataclasses.dataclass
 class Config:
     default_sources: typing.ClassVar[list[Path]] = [Path(".")]  # Not init attribute
-    gitignore_patterns: list[GitWildMatchPattern] = dataclasses.field(
-        default_factory=list, init=False, repr=False, compare=False
+    gitignore_matcher: Gitignore | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
     )  # Not init attribute
     use_color: bool = dataclasses.field(init=False)  # Not init attribute
 
@@ -70,6 +97,14 @@ class Config:
     check: bool = False
     ignore_init: bool = False
     color: ColorSelect = ColorSelect.AUTO
+    jobs: int | None = None
+    cache_dir: Path | None = None
+    changed_since: str | None = None
+    git_files: bool = False
+    files_from: Path | None = None
+    profile: bool = False
+    profile_slowest: int = 10
+    trace_out: Path | None = None
 
     @classmethod
     @functools.cache
@@ -87,21 +122,78 @@ class Config:
         self.diff = self.diff or self.permission
         self.remove = self.remove or not any((self.diff, self.check))
         self.use_color = self.is_use_color(self.color)
+        self.jobs = self.jobs if self.jobs is not None and self.jobs > 0 else utils.cpu_count()
 
         if self.gitignore:
-            self.gitignore_patterns = utils.get_exclude_list_from_gitignore()
+            self.gitignore_matcher = Gitignore.discover()
 
         if self.ignore_init:
             self.exclude = "|".join([self.exclude, C.INIT_FILE_IGNORE_REGEX])
 
     def get_paths(self) -> typing.Iterator[Path]:
+        if self.files_from is not None:
+            yield from self.filter_paths(self.get_paths_from(self.files_from))
+            return
+
+        if self.changed_since is not None:
+            yield from self.get_changed_paths(self.changed_since)
+            return
+
+        if self.git_files:
+            try:
+                git_paths = utils.get_git_paths(self.sources)
+            except GitCommandError:  # not a work tree, fall back to walking the sources
+                pass
+            else:
+                yield from self.filter_paths(git_paths)
+                return
+
+        # Overlapping sources, such as a package and one of its subpackages,
+        # report each file once.
+        seen: set[str] = set()
         for source_path in self.sources:
-            yield from utils.list_paths(
+            for path in utils.list_paths(
                 source_path,
                 include=self.include,
                 exclude=self.exclude,
-                gitignore_patterns=self.gitignore_patterns,
-            )
+                gitignore=self.gitignore_matcher,
+            ):
+                if len(self.sources) == 1:
+                    yield path
+                    continue
+
+                real_path = os.path.realpath(path)
+                if real_path not in seen:
+                    seen.add(real_path)
+                    yield path
+
+    def filter_paths(self, paths: typing.Iterable[Path]) -> typing.Iterator[Path]:
+        """Applies ``include`` and ``exclude`` to paths listed without walking
+        the sources."""
+        include_regex, exclude_regex = re.compile(self.include), re.compile(self.exclude)
+        for path in paths:
+            if include_regex.search(str(path)) and not exclude_regex.search(str(path)):
+                yield path
+
+    @staticmethod
+    def get_paths_from(files_from: Path) -> typing.Iterator[Path]:
+        if files_from == Path("-"):
+            yield from utils.read_paths(sys.stdin.buffer)
+        else:
+            with open(files_from, "rb") as stream:
+                yield from utils.read_paths(stream)
+
+    def get_changed_paths(self, ref: str) -> typing.Iterator[Path]:
+        sources = [Path(os.path.abspath(source_path)) for source_path in self.sources]
+        for path in utils.get_changed_paths(ref):
+            absolute_path = Path(os.path.abspath(path))
+            if any(source == absolute_path or source in absolute_path.parents for source in sources):
+                yield from utils.list_paths(
+                    path,
+                    include=self.include,
+                    exclude=self.exclude,
+                    gitignore=self.gitignore_matcher,
+                )
 
     @classmethod
     def get_color_choices(cls) -> list[str]:
@@ -173,6 +265,10 @@ class ParseConfig:
                     cfg_context[key] = parser.getboolean(self.config_section, key)
                 elif key_type == str:
                     cfg_context[key] = value  # type: ignore
+                elif key_type == int:
+                    cfg_context[key] = parser.getint(self.config_section, key)
+                elif key_type == Path:
+                    cfg_context[key] = Path(value)  # type: ignore
                 elif key_type == list[Path]:
                     cfg_context[key] = [Path(p) for p in get_config_as_list(key)]  # type: ignore
 
@@ -201,6 +297,11 @@ class ParseConfig:
             sources = toml_context.get("sources", None)
             if sources is not None:
                 toml_context["sources"] = [Path(path) for path in sources]
+
+            for key in ("cache_dir", "files_from", "trace_out"):
+                value = toml_context.get(key, None)
+                if value is not None:
+                    toml_context[key] = Path(value)
         return toml_context
 
     @classmethod
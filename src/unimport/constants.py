@@ -4,10 +4,12 @@ import sysconfig
 
 __all__ = (
     "BUILTIN_MODULE_NAMES",
+    "CACHE_MAX_SIZE",
     "EXCLUDE_REGEX_PATTERN",
     "GLOB_PATTERN",
     "INCLUDE_REGEX_PATTERN",
     "INIT_FILE_IGNORE_REGEX",
+    "PARSED_STRING_CACHE_SIZE",
     "PY39_PLUS",
     "PY310_PLUS",
     "PY312_PLUS",
@@ -23,6 +25,10 @@ INCLUDE_REGEX_PATTERN = r"\.(py)$"
 EXCLUDE_REGEX_PATTERN = r"^$"
 INIT_FILE_IGNORE_REGEX = r"__init__\.py"
 
+# CACHE
+CACHE_MAX_SIZE = 256 * 1024 * 1024  # bytes
+PARSED_STRING_CACHE_SIZE = 4096  # string annotations and type comments
+
 # TUPLE
 DEF_TUPLE = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
 AST_FUNCTION_TUPLE = (ast.FunctionDef, ast.AsyncFunctionDef)
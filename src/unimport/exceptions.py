@@ -4,6 +4,7 @@ __all__ = (
     "UnimportBaseException",
     "UnknownConfigKeyException",
     "ConfigFileNotFound",
+    "GitCommandError",
 )
 
 
@@ -33,3 +34,12 @@ class UnsupportedConfigFile(UnimportBaseException):
 
     def __str__(self):
         return f"Unsupported config file '{self.config_file}'"
+
+
+class GitCommandError(UnimportBaseException):
+    def __init__(self, command: str, error: str) -> None:
+        self.command = command
+        self.error = error
+
+    def __str__(self):
+        return f"Git command '{self.command}' failed: {self.error}"
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+import re
+import typing
+from pathlib import Path
+
+from pathspec.patterns import GitWildMatchPattern
+
+__all__ = ("Gitignore",)
+
+
+# pathspec names a group in every pattern; names can not repeat in one regex.
+NAMED_GROUP_REGEX = re.compile(r"(?<!\\)\(\?P<\w+>")
+
+
+class _Level(typing.NamedTuple):
+    regex: re.Pattern
+    includes: tuple[bool, ...]
+
+
+def _compile(lines: typing.Iterable[str]) -> _Level | None:
+    """Compiles the patterns of one ignore file into a single regex.
+
+    The patterns are joined in reverse order, so the alternative that
+    matches first is the last matching pattern of the file, which is the
+    one git obeys.
+    """
+    patterns = []
+    for line in lines:
+        regex, include = GitWildMatchPattern.pattern_to_regex(line)
+        if regex is not None:
+            patterns.append((NAMED_GROUP_REGEX.sub("(?:", regex), include))
+
+    if not patterns:
+        return None
+
+    patterns.reverse()
+    return _Level(
+        regex=re.compile("|".join(f"({regex})" for regex, _ in patterns)),
+        includes=tuple(include for _, include in patterns),
+    )
+
+
+def _read_lines(path: str) -> list[str]:
+    try:
+        with open(path, encoding="utf-8", errors="surrogateescape") as stream:
+            return stream.read().splitlines()
+    except OSError:
+        return []
+
+
+@dataclasses.dataclass
+class Gitignore:
+    """The ignore rules of a git work tree: ``.git/info/exclude`` and every
+    ``.gitignore`` file from ``root`` down.
+
+    Each ignore file is read once, when a directory below it is first
+    walked, and compiled to a single regex. Rules of deeper files take
+    precedence over shallower ones and, within a file, the last matching
+    pattern wins, so ``!pattern`` re-includes paths as it does in git.
+    """
+
+    root: str
+    exclude_path: str | None = None
+
+    _levels: dict[str, _Level | None] = dataclasses.field(default_factory=dict, init=False, repr=False)
+
+    @classmethod
+    def discover(cls, path: Path = Path(".")) -> Gitignore:
+        """Finds the work tree that contains ``path``, falling back to
+        ``path`` itself outside a repository."""
+        start = directory = os.path.abspath(path)
+        while True:
+            git_path = os.path.join(directory, ".git")
+            if os.path.isdir(git_path):
+                return cls(directory, os.path.join(git_path, "info", "exclude"))
+            if os.path.exists(git_path):  # worktrees and submodules
+                return cls(directory)
+
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return cls(start)
+            directory = parent
+
+    def _get_level(self, directory: str) -> _Level | None:
+        try:
+            return self._levels[directory]
+        except KeyError:
+            lines = _read_lines(os.path.join(directory, ".gitignore"))
+            if directory == self.root and self.exclude_path is not None:
+                lines = _read_lines(self.exclude_path) + lines
+
+            level = self._levels[directory] = _compile(lines)
+            return level
+
+    def compile(self, directory: Path) -> typing.Callable[[str, bool], bool] | None:
+        """Returns a function that tells whether an entry of ``directory``,
+        given by its name and whether it is a directory, is ignored, or
+        ``None`` when no rule applies to the directory."""
+        absolute_directory = os.path.abspath(directory)
+        if absolute_directory == self.root:
+            parts: list[str] = []
+        elif absolute_directory.startswith(os.path.join(self.root, "")):
+            parts = absolute_directory[len(os.path.join(self.root, "")) :].split(os.sep)
+        else:
+            return None
+
+        levels = []
+        for depth in range(len(parts) + 1):
+            level = self._get_level(os.path.join(self.root, *parts[:depth]))
+            if level is not None:
+                prefix = "".join(f"{part}/" for part in parts[depth:])
+                levels.append((prefix, level))
+
+        if not levels:
+            return None
+
+        levels.reverse()  # deeper ignore files take precedence
+
+        def is_ignored(name: str, is_dir: bool) -> bool:
+            suffix = "/" if is_dir else ""
+            for prefix, level in levels:
+                match = level.regex.match(f"{prefix}{name}{suffix}")
+                if match is not None:
+                    return level.includes[match.lastindex - 1]  # type: ignore[operator]
+            return False
+
+        return is_ignored
+
+    def is_ignored(self, path: Path) -> bool:
+        path = Path(os.path.abspath(path))
+        is_ignored = self.compile(path.parent)
+        return is_ignored is not None and is_ignored(path.name, path.is_dir())
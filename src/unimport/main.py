@@ -1,23 +1,30 @@
 from __future__ import annotations
 
-import contextlib
+import ast
+import collections
 import dataclasses
+import functools
+import itertools
+import sys
 import typing
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 
 from unimport import commands, utils
 from unimport.analyzers import MainAnalyzer
+from unimport.cache import Cache, Manifest
 from unimport.color import paint
 from unimport.config import Config
 from unimport.enums import Color
-from unimport.statement import Import
-
-if typing.TYPE_CHECKING:
-    from unimport.statement import ImportFrom
-
+from unimport.profiler import Profiler
+from unimport.statement import Import, ImportFrom
 
 __all__ = ("Main",)
 
+# The number of files a worker process should have to analyze before one is
+# started for them.
+FILES_PER_JOB = 32
+
 
 @dataclasses.dataclass
 class _Result:
@@ -26,6 +33,142 @@ class _Result:
     source: str
     encoding: str
     newline: str | None = None
+    refactor_result: str | None = dataclasses.field(default=None, repr=False)
+    syntax_error: str | None = None
+    cache_hit: bool | None = None
+    profiler: Profiler | None = dataclasses.field(default=None, repr=False)
+    import_free: bool = False
+    is_clean: bool = False
+
+
+# A path to analyze, its stat data for the manifest and its known result.
+_Item = tuple[Path, "list[int] | None", "_Result | None"]
+
+
+def _is_cacheable(unused_imports: list[Import | ImportFrom]) -> bool:
+    # Star import suggestions depend on the installed packages, not only on the
+    # source, so those results are never cached.
+    return not any(isinstance(imp, ImportFrom) and imp.star for imp in unused_imports)
+
+
+def _get_unused_imports(
+    source: str, path: Path, include_star_import: bool, profiler: Profiler | None = None
+) -> tuple[list[Import | ImportFrom], str | None, bool]:
+    analyzer = MainAnalyzer(
+        source=source, path=path, include_star_import=include_star_import, quick_reject=True, profiler=profiler
+    )
+    syntax_error = None
+    try:
+        analyzer.traverse()
+    except SyntaxError as exc:
+        syntax_error = str(exc)
+
+    try:
+        unused_imports = [
+            imp.detach() for imp in analyzer.session.get_unused_imports(include_star_import=include_star_import)
+        ]
+        return unused_imports, syntax_error, analyzer.is_clean
+    finally:
+        analyzer.clear()
+
+
+def _analyze(
+    path: Path, *, include_star_import: bool, refactor: bool, cache: Cache | None = None, profile: bool = False
+) -> _Result:
+    """Analyze one file; runs in a worker process when ``--jobs`` is greater
+    than one, so everything it returns must be picklable."""
+    if refactor:
+        # The refactor module and the parts of libcst it needs take a while to
+        # import; keep that out of the spans of the first file.
+        import unimport.refactor  # noqa: F401
+
+    profiler = Profiler(enabled=profile, path=str(path))
+    with profiler.span("analyze"):
+        result = _analyze_file(
+            path, include_star_import=include_star_import, refactor=refactor, cache=cache, profiler=profiler
+        )
+
+    result.profiler = profiler if profile else None
+    return result
+
+
+def _analyze_all(analyze: typing.Callable[[Path], _Result], paths: list[Path]) -> list[_Result]:
+    return [analyze(path) for path in paths]
+
+
+def _batch(items: typing.Iterable[_Item], size: int) -> typing.Iterator[list[_Item]]:
+    """Groups the items in order into lists of ``size`` items to analyze,
+    along with the known results between them."""
+    batch: list[_Item] = []
+    unknown_count = 0
+    for item in items:
+        batch.append(item)
+        unknown_count += item[2] is None
+        if unknown_count == size:
+            yield batch
+            batch, unknown_count = [], 0
+    if batch:
+        yield batch
+
+
+def _analyze_file(
+    path: Path, *, include_star_import: bool, refactor: bool, cache: Cache | None, profiler: Profiler
+) -> _Result:
+    with profiler.span("read"):
+        source, encoding, newline = utils.read(path)
+
+    with profiler.span("scan"):
+        import_free = not utils.has_imports(source)
+    if import_free:  # nothing to report but syntax errors, the file is only parsed
+        syntax_error = None
+        with profiler.span("parse"):
+            try:
+                ast.parse(source, type_comments=True)
+            except SyntaxError as exc:
+                syntax_error = str(exc)
+        return _Result(
+            [], path, source, encoding, newline, source if refactor else None, syntax_error, import_free=True
+        )
+
+    key = entry = None
+    if cache is not None:
+        with profiler.span("cache"):
+            key = cache.key(source, include_star_import=include_star_import)
+            entry = cache.get(key)
+
+    is_clean = False
+    if entry is not None:
+        unused_imports = cache.load_imports(entry["unused_imports"])
+        syntax_error = entry["syntax_error"]
+        refactor_result = entry["refactor_result"]
+    else:
+        unused_imports, syntax_error, is_clean = _get_unused_imports(source, path, include_star_import, profiler)
+        refactor_result = None
+
+    is_changed = entry is None
+    if refactor and refactor_result is None:
+        from unimport.refactor import refactor_string
+
+        with profiler.span("refactor"):
+            refactor_result = refactor_string(source=source, unused_imports=unused_imports)
+        is_changed = is_changed or bool(unused_imports)
+
+    if cache is not None and key is not None and is_changed and _is_cacheable(unused_imports):
+        with profiler.span("cache"):
+            cache.set(
+                key,
+                {
+                    "unused_imports": cache.dump_imports(unused_imports),
+                    "syntax_error": syntax_error,
+                    # An unchanged source is not worth storing twice.
+                    "refactor_result": refactor_result if unused_imports else None,
+                },
+            )
+
+    cache_hit = entry is not None if cache is not None else None
+    return _Result(
+        unused_imports, path, source, encoding, newline, refactor_result, syntax_error, cache_hit, is_clean=is_clean
+    )
 
 
 @dataclasses.dataclass
@@ -36,67 +179,165 @@ class Main:
     is_syntax_error: bool = dataclasses.field(init=False, default=False)
     is_unused_imports: bool = dataclasses.field(init=False, default=False)
     refactor_applied: bool = dataclasses.field(init=False, default=False)
+    cache: Cache | None = dataclasses.field(init=False, default=None)
+    manifest: Manifest | None = dataclasses.field(init=False, default=None)
+    profiler: Profiler = dataclasses.field(init=False)
+    import_free_files: int = dataclasses.field(init=False, default=0)
+    clean_files: int = dataclasses.field(init=False, default=0)
 
     def __post_init__(self):
         self.config = self.argv_to_config()
+        self.profiler = Profiler(enabled=self.config.profile or self.config.trace_out is not None)
+        if self.config.cache_dir is not None:
+            self.cache = Cache(self.config.cache_dir)
+            self.manifest = Manifest.load(
+                self.cache.get_manifest_path(include_star_import=self.config.include_star_import)
+            )
 
     def argv_to_config(self) -> Config:
-        import sys
-
         from unimport.config import ParseConfig
 
         return ParseConfig.parse_args(
             commands.generate_parser().parse_args(self.argv if self.argv is not None else sys.argv[1:])
         )
 
-    @contextlib.contextmanager
-    def analysis(self, source: str, path: Path) -> typing.Iterator:
-        analyzer = MainAnalyzer(
-            source=source,
-            path=path,
+    def get_results(self) -> typing.Iterator[_Result]:
+        refactor = any((self.config.diff, self.config.remove))
+        analyze = functools.partial(
+            _analyze,
             include_star_import=self.config.include_star_import,
+            refactor=refactor,
+            cache=self.cache,
+            profile=self.profiler.enabled,
         )
-        try:
-            analyzer.traverse()
-        except SyntaxError as exc:
-            print(
-                paint(str(exc), Color.RED, self.config.use_color)
-                + " at "
-                + paint(path.as_posix(), Color.GREEN, self.config.use_color)
-            )
-            self.is_syntax_error = True
+        paths = self.profiler.iterate("discover", self.config.get_paths())
+        for result in self._map(analyze, paths, refactor=refactor):
+            if result.profiler is not None:
+                self.profiler.extend(result.profiler)
+            self.import_free_files += result.import_free
+            self.clean_files += result.is_clean
+            if self.cache is not None:
+                self.cache.hits += result.cache_hit is True
+                self.cache.misses += result.cache_hit is False
+
+            if result.syntax_error is not None:
+                print(
+                    paint(result.syntax_error, Color.RED, self.config.use_color)
+                    + " at "
+                    + paint(result.path.as_posix(), Color.GREEN, self.config.use_color)
+                )
+                self.is_syntax_error = True
+
+            if self.is_unused_imports is False:
+                self.is_unused_imports = result.unused_imports != []
+
+            yield result
+
+    def _map(
+        self, analyze: typing.Callable[[Path], _Result], paths: typing.Iterable[Path], *, refactor: bool
+    ) -> typing.Iterator[_Result]:
+        """Yields the analysis of each path in the given order, spreading the
+        work over a process pool when there are enough files for more than
+        one worker."""
+        items: typing.Iterator[_Item] = map(functools.partial(self._get_known_result, refactor=refactor), paths)
+        if self.config.jobs > 1:
+            # A worker costs about as much to start as a few dozen files cost to
+            # analyze, more where it imports unimport again (spawn, forkserver),
+            # so paths are read ahead only until the number of workers is known.
+            read_ahead: list[_Item] = []
+            unknown_count = 0
+            for item in items:
+                read_ahead.append(item)
+                unknown_count += item[2] is None
+                if unknown_count == self.config.jobs * FILES_PER_JOB:
+                    break
 
+            items = itertools.chain(read_ahead, items)
+            jobs = min(self.config.jobs, unknown_count // FILES_PER_JOB)
+            if jobs > 1:
+                yield from self._map_in_pool(analyze, items, jobs=jobs)
+                return
+
+        for path, stat, result in items:
+            yield result if result is not None else self._remember(stat, analyze(path))
+
+    def _map_in_pool(
+        self, analyze: typing.Callable[[Path], _Result], items: typing.Iterator[_Item], *, jobs: int
+    ) -> typing.Iterator[_Result]:
+        """Submits the unknown paths in batches, keeping two batches per worker
+        in flight, so paths are read as the workers need them."""
+        executor = ProcessPoolExecutor(max_workers=jobs)
         try:
-            yield
+            pending: collections.deque[tuple[list[_Item], Future[list[_Result]] | None]] = collections.deque()
+            for batch in _batch(items, max(1, FILES_PER_JOB // 2)):
+                unknown_paths = [path for path, _, result in batch if result is None]
+                future = executor.submit(_analyze_all, analyze, unknown_paths) if unknown_paths else None
+                pending.append((batch, future))
+                if len(pending) == jobs * 2:
+                    yield from self._collect(*pending.popleft())
+
+            while pending:
+                yield from self._collect(*pending.popleft())
         finally:
-            analyzer.clear()
+            executor.shutdown(cancel_futures=True)
 
-    def get_results(self) -> typing.Iterator[_Result]:
-        for path in self.config.get_paths():
-            source, encoding, newline = utils.read(path)
+    def _collect(self, batch: list[_Item], future: Future[list[_Result]] | None) -> typing.Iterator[_Result]:
+        results = iter(future.result() if future is not None else ())
+        for _, stat, result in batch:
+            yield result if result is not None else self._remember(stat, next(results))
 
-            with self.analysis(source, path):
-                unused_imports = list(Import.get_unused_imports(include_star_import=self.config.include_star_import))
-                if self.is_unused_imports is False:
-                    self.is_unused_imports = unused_imports != []
+    def _get_known_result(self, path: Path, *, refactor: bool) -> _Item:
+        """Looks the path up in the manifest by its ``stat`` data; a known
+        result is only usable when the source itself is not needed."""
+        if self.manifest is None or self.cache is None:
+            return path, None, None
 
-                yield _Result(unused_imports, path, source, encoding, newline)
+        stat = self.manifest.get_stat(path)
+        entry = self.manifest.get(path, stat) if stat is not None else None
+        if entry is None or (refactor and entry["unused_imports"]):
+            return path, stat, None
+
+        # The file is not read, an empty source stands in for it as there is
+        # nothing to refactor.
+        self.cache.unread += 1
+        result = _Result(
+            Cache.load_imports(entry["unused_imports"]),
+            path,
+            source="",
+            encoding="utf-8",
+            refactor_result="" if refactor else None,
+            syntax_error=entry["syntax_error"],
+            cache_hit=True,
+        )
+        return path, stat, result
+
+    def _remember(self, stat: list[int] | None, result: _Result) -> _Result:
+        if self.manifest is not None and stat is not None and _is_cacheable(result.unused_imports):
+            self.manifest.set(
+                result.path,
+                stat,
+                unused_imports=Cache.dump_imports(result.unused_imports),
+                syntax_error=result.syntax_error,
+            )
+        return result
 
     def check(self, result: _Result) -> None:
         commands.check(result.path, result.unused_imports, self.config.use_color)
 
     def remove(self, result: _Result, refactor_result):
-        commands.remove(
-            result.path,
-            result.encoding,
-            result.newline,
-            refactor_result,
-            self.config.use_color,
-        )
+        with self.profiler.span("write", str(result.path)):
+            commands.remove(
+                result.path,
+                result.encoding,
+                result.newline,
+                refactor_result,
+                self.config.use_color,
+            )
         self.refactor_applied = True
 
     def diff(self, result, refactor_result):
-        return commands.diff(result.path, result.source, refactor_result, self.config.use_color)
+        with self.profiler.span("diff", str(result.path)):
+            return commands.diff(result.path, result.source, refactor_result, self.config.use_color)
 
     @staticmethod
     def permission(result) -> bool:
@@ -104,20 +345,30 @@ class Main:
 
     @classmethod
     def run(cls, argv: typing.Sequence[str] | None = None) -> Main:
-        from unimport.refactor import refactor_string
-
         self = cls(argv)
         for result in self.get_results():
             if self.config.check:
                 self.check(result)
             if any((self.config.diff, self.config.remove)):
-                refactor_result = refactor_string(source=result.source, unused_imports=result.unused_imports)
+                refactor_result = result.refactor_result
                 if self.config.diff:
                     exists_diff = self.diff(result, refactor_result)
                     if self.config.permission and exists_diff:
                         self.config.remove = self.permission(result)
                 if self.config.remove and result.source != refactor_result:
                     self.remove(result, refactor_result)
+
+        if self.manifest is not None:
+            self.manifest.save()
+        if self.cache is not None:
+            self.cache.evict()
+            print(self.cache.summary(), file=sys.stderr)
+        if self.config.profile:
+            print(self.profiler.report(slowest=self.config.profile_slowest), file=sys.stderr)
+            print(f"\nFiles without imports, only checked for syntax errors: {self.import_free_files}", file=sys.stderr)
+            print(f"Files clean by their tokens, not traversed: {self.clean_files}", file=sys.stderr)
+        if self.config.trace_out is not None:
+            self.profiler.write_trace(self.config.trace_out)
         return self
 
     def exit_code(self):
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import collections
+import contextlib
+import dataclasses
+import json
+import os
+import threading
+import time
+import typing
+from pathlib import Path
+
+__all__ = ("Profiler", "Span")
+
+
+@dataclasses.dataclass(frozen=True)
+class Span:
+    """One timed phase; times are in nanoseconds and ``start`` is read from
+    ``time.perf_counter_ns``, which every process of a run shares."""
+
+    name: str
+    path: str
+    start: int
+    wall: int
+    cpu: int
+    depth: int
+    pid: int
+    tid: int
+
+
+@dataclasses.dataclass
+class Profiler:
+    """Records the wall and CPU time of each phase of a run and a few
+    counters per file.
+
+    A disabled profiler records nothing and its spans cost a single
+    attribute check, so analyzers can always be handed one.
+    """
+
+    enabled: bool = False
+    path: str = ""
+
+    spans: list[Span] = dataclasses.field(default_factory=list, repr=False)
+    counters: dict[str, dict[str, int]] = dataclasses.field(default_factory=dict, repr=False)
+
+    _depth: int = dataclasses.field(default=0, init=False, repr=False, compare=False)
+
+    def span(self, name: str, path: str | None = None) -> typing.ContextManager[None]:
+        if not self.enabled:
+            return contextlib.nullcontext()
+
+        return self._span(name, self.path if path is None else path)
+
+    @contextlib.contextmanager
+    def _span(self, name: str, path: str) -> typing.Iterator[None]:
+        depth = self._depth
+        self._depth += 1
+        start, cpu_start = time.perf_counter_ns(), time.thread_time_ns()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter_ns() - start, time.thread_time_ns() - cpu_start
+            self._depth = depth
+            self.spans.append(Span(name, path, start, wall, cpu, depth, os.getpid(), threading.get_ident()))
+
+    def iterate(self, name: str, iterable: typing.Iterable[typing.Any]) -> typing.Iterator[typing.Any]:
+        """Yields from ``iterable``, timing the production of each item as a
+        ``name`` span."""
+        iterator = iter(iterable)
+        while True:
+            with self.span(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def count(self, **counters: int) -> None:
+        if self.enabled:
+            self.counters[self.path] = counters
+
+    def extend(self, profiler: Profiler) -> None:
+        self.spans.extend(profiler.spans)
+        self.counters.update(profiler.counters)
+
+    def report(self, slowest: int) -> str:
+        """Formats the time of each phase, the ``slowest`` files and their
+        counters as plain text tables."""
+        phases: dict[str, list[int]] = collections.defaultdict(lambda: [0, 0, 0])
+        files: dict[str, list[int]] = collections.defaultdict(lambda: [0, 0])
+        for span in self.spans:
+            phase = phases[span.name]
+            phase[0] += 1
+            phase[1] += span.wall
+            phase[2] += span.cpu
+            if span.path and span.depth == 0:
+                files[span.path][0] += span.wall
+                files[span.path][1] += span.cpu
+
+        lines = [f"{'phase':<16}{'calls':>8}{'wall ms':>12}{'cpu ms':>12}"]
+        for name, (calls, wall, cpu) in sorted(phases.items(), key=lambda item: -item[1][1]):
+            lines.append(f"{name:<16}{calls:>8}{wall / 1e6:>12.2f}{cpu / 1e6:>12.2f}")
+
+        lines.append("")
+        lines.append(f"{'wall ms':>10}{'cpu ms':>10}{'names':>8}{'scopes':>8}{'imports':>8}  path")
+        for path, (wall, cpu) in sorted(files.items(), key=lambda item: -item[1][0])[:slowest]:
+            counters = self.counters.get(path, {})
+            lines.append(
+                f"{wall / 1e6:>10.2f}{cpu / 1e6:>10.2f}"
+                f"{counters.get('names', 0):>8}{counters.get('scopes', 0):>8}{counters.get('imports', 0):>8}  {path}"
+            )
+
+        return "\n".join(lines)
+
+    def get_trace_events(self) -> list[dict[str, typing.Any]]:
+        """Returns the spans as Chrome trace events, one lane per process and
+        thread; times are in microseconds from the first span."""
+        if not self.spans:
+            return []
+
+        main_pid = os.getpid()
+        origin = min(span.start for span in self.spans)
+        events: list[dict[str, typing.Any]] = []
+        for pid in sorted({span.pid for span in self.spans}):
+            name = "unimport" if pid == main_pid else f"worker {pid}"
+            events.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": name}})
+
+        for span in sorted(self.spans, key=lambda span: (span.start, span.depth)):
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": "unimport",
+                    "ph": "X",
+                    "ts": (span.start - origin) / 1e3,
+                    "dur": span.wall / 1e3,
+                    "pid": span.pid,
+                    "tid": span.tid,
+                    "args": {"path": span.path, "cpu_ms": span.cpu / 1e6},
+                }
+            )
+        return events
+
+    def write_trace(self, path: Path) -> None:
+        with open(path, "w", encoding="utf-8") as stream:
+            json.dump({"traceEvents": self.get_trace_events(), "displayTimeUnit": "ms"}, stream)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import io
+import re
+import tokenize
+
+__all__ = ("get_tokens", "is_clean")
+
+
+# Names whose meaning depends on more than the tokens around them.
+BAIL_NAMES = frozenset({"__all__", "TYPE_CHECKING"})
+# Soft keywords; an import binding one of them is left to the analyzer.
+SOFT_KEYWORDS = frozenset({"case", "match", "type"})
+# Tokenizing is the costly part of the check, so sources that would be left
+# to the analyzer anyway are ruled out by their text first: bail names,
+# indented imports and star imports.
+BAIL_REGEX = re.compile(
+    r"__all__|TYPE_CHECKING|^[ \t]+(?:import\s+\w|from\s+[\w.]+\s+import\b)|\bimport\s*\(?\s*\*", re.MULTILINE
+)
+# A name after one of these tokens is an attribute, a def or class name, an
+# alias or an f-string conversion, none of which the analyzer sees as a name.
+NOT_NAME_PREVIOUS_TOKENS = frozenset({".", "def", "class", "as", "!"})
+# A name after one of these tokens in a parameter list is a parameter.
+PARAMETER_PREVIOUS_TOKENS = frozenset({"(", ",", "*", "**", "lambda"})
+
+
+def _get_bindings(statement: list[str]) -> list[str] | None:
+    """Returns the names an import statement binds, or ``None`` for a star
+    import."""
+    if statement[0] == "import":
+        parts = " ".join(statement[1:]).split(",")
+        return [part.split()[-1] if " as " in part else part.split()[0] for part in parts]
+
+    module_end = statement.index("import")
+    if "".join(statement[1:module_end]) == "__future__":
+        return []
+
+    names = [string for string in statement[module_end + 1 :] if string not in ("(", ")")]
+    if names == ["*"]:
+        return None
+
+    return [part.split()[-1] for part in " ".join(names).split(",") if part.strip()]
+
+
+def get_tokens(source: str) -> list[tokenize.TokenInfo] | None:
+    """Returns every token of the source, or ``None`` when it does not
+    tokenize."""
+    try:
+        return list(tokenize.generate_tokens(io.StringIO(source).readline))
+    except (tokenize.TokenError, SyntaxError):
+        return None
+
+
+def is_clean(source: str, tokens: list[tokenize.TokenInfo] | None = None) -> bool:
+    """Tells from the tokens of the source alone that it certainly has no
+    unused imports; ``False`` leaves the decision to the analyzer.
+
+    Every import has to be a module level statement binding a name no other
+    import binds, and that name has to appear after the import where the
+    analyzer sees a name: not as an attribute, a parameter, a keyword
+    argument, a def or class name, an alias or in a global declaration.
+    Sources with star imports, ``__all__``, ``TYPE_CHECKING``, case
+    patterns or type parameters are always left to the analyzer.
+
+    The source is tokenized unless its ``tokens`` are given.
+    """
+    if BAIL_REGEX.search(source):
+        return False
+
+    if tokens is None:
+        tokens = get_tokens(source)
+        if tokens is None:
+            return False
+    tokens = [token for token in tokens if token.type not in (tokenize.NL, tokenize.COMMENT)]
+
+    imports: dict[str, int] = {}  # binding -> line of its import
+    uses: dict[str, int] = {}  # name -> line of its last use
+
+    brackets: list[bool] = []  # whether each open bracket holds the parameters of a def
+    lambdas: list[int] = []  # bracket depth of each lambda whose parameters are being read
+    parameters_index = -1  # index of the bracket that opens the parameters of a def
+    is_declaration = False  # inside a global or nonlocal statement
+    is_statement_start = True
+
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        string = token.string
+
+        if token.type in (tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT) or string == ";":
+            is_declaration = False
+            is_statement_start = True
+            index += 1
+            continue
+
+        if token.type == tokenize.OP:
+            if string in ("(", "[", "{"):
+                brackets.append(index == parameters_index)
+            elif string in (")", "]", "}") and brackets:
+                brackets.pop()
+            elif string == ":" and lambdas and lambdas[-1] == len(brackets):
+                lambdas.pop()
+
+        elif token.type == tokenize.NAME:
+            next_string = tokens[index + 1].string
+            if is_statement_start and string in ("import", "from"):
+                end = index
+                while tokens[end].type not in (tokenize.NEWLINE, tokenize.ENDMARKER) and tokens[end].string != ";":
+                    end += 1
+
+                bindings = _get_bindings([statement_token.string for statement_token in tokens[index:end]])
+                if token.start[1] != 0 or bindings is None:  # nested or star import
+                    return False
+                for binding in bindings:
+                    if binding in imports or binding in SOFT_KEYWORDS:
+                        return False
+                    imports[binding] = token.start[0]
+
+                index = end
+                continue
+
+            if string == "import" or string in BAIL_NAMES:
+                return False
+            if is_statement_start and string in ("case", "type") and next_string not in ("=", ".", ":"):
+                return False
+
+            previous_string = tokens[index - 1].string if index else ""
+            if string in ("def", "class"):
+                if tokens[index + 2].string == "[":  # type parameters
+                    return False
+                if string == "def":
+                    parameters_index = index + 2
+            elif string in ("global", "nonlocal"):
+                is_declaration = True
+            elif string == "lambda":
+                lambdas.append(len(brackets))
+            elif is_declaration or previous_string in NOT_NAME_PREVIOUS_TOKENS:
+                pass
+            elif brackets and brackets[-1] and previous_string in PARAMETER_PREVIOUS_TOKENS:
+                pass
+            elif lambdas and lambdas[-1] == len(brackets) and previous_string in PARAMETER_PREVIOUS_TOKENS:
+                pass
+            elif next_string == "=" and previous_string in ("(", ","):  # keyword argument
+                pass
+            else:
+                uses[string] = token.start[0]
+
+        is_statement_start = False
+        index += 1
+
+    return all(uses.get(binding, 0) >= lineno for binding, lineno in imports.items())
@@ -1,36 +1,68 @@
 from __future__ import annotations
 
+import array
 import ast
+import bisect
+import collections
 import dataclasses
 import typing
 
-__all__ = ("Import", "ImportFrom", "Name", "Scope")
+from unimport import constants as C
+from unimport.profiler import Profiler
 
+__all__ = ("AnalysisSession", "Import", "ImportFrom", "ImportTrie", "Name", "NameTable", "Scope")
 
-@dataclasses.dataclass
-class Import:
-    imports: typing.ClassVar[list[Import | ImportFrom]] = []
 
+# Records are slotted where dataclasses support it, a file can register
+# thousands of them.
+SLOTS: dict[str, bool] = {"slots": True} if C.PY310_PLUS else {}
+
+
+@dataclasses.dataclass(**SLOTS)
+class Import:
     lineno: int
     column: int
     name: str
     package: str
 
-    node: ast.Import | ast.ImportFrom = dataclasses.field(init=False, repr=False, compare=False)
     is_type_checking: bool = dataclasses.field(init=False, repr=False, compare=False, default=False)
+    session: AnalysisSession = dataclasses.field(init=False, repr=False, compare=False)
+    scope: Scope = dataclasses.field(init=False, repr=False, compare=False)
+    parts: tuple[str, ...] = dataclasses.field(init=False, repr=False, compare=False)  # the dotted components
+
+    def __post_init__(self) -> None:
+        self.parts = tuple(self.name.split("."))
 
     def __len__(self) -> int:
-        return len(self.name.split("."))
+        return len(self.parts)
+
+    def __getstate__(self) -> dict:
+        # Leave the analysis session and the scope behind.
+        return {
+            field.name: getattr(self, field.name)
+            for field in dataclasses.fields(self)
+            if field.name not in ("session", "scope") and hasattr(self, field.name)
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def detach(self) -> Import:
+        """Returns a copy of the import as a result, without references to
+        the analysis session and the scope, so neither they nor the AST of
+        the scope outlive the analysis."""
+        return dataclasses.replace(self)
 
     def is_match_sub_packages(self, name_name: str) -> bool:
-        return self.name.split(".")[0] == name_name.split(".")[0]
-
-    @property
-    def scope(self):
-        return Scope.get_scope_by_current_node(self)
+        return self.parts[0] == name_name.partition(".")[0]
 
     def is_used(self) -> bool:
-        for name in self.scope.names:
+        # A name can only match an import that binds its first component.
+        for name in self.session.names_by_head.get(self.parts[0], ()):
+            if not name.scope.is_within(self.scope):
+                continue
+
             if self.is_type_checking:
                 if name.match_2(self):
                     return True
@@ -45,58 +77,41 @@ class Import:
     def match_nearest_duplicate_import(self, name: Name) -> bool:
         nearest_import = None
 
-        scope = name.scope
+        scope: Scope | None = name.scope
         while scope:
-            imports = [
-                _import
-                for _import in scope.imports
-                if name.match_2(_import) and name.lineno > _import.lineno and not _import.is_type_checking
-            ]
-            scope = scope.parent
-
-            if imports:
-                nearest_import = max(
-                    filter(
-                        lambda _import: _import.lineno == max(imports, key=lambda _import: _import.lineno).lineno,
-                        imports,
-                    ),
-                    key=lambda _import: _import.column,
-                )
+            scope_nearest_import = scope.get_nearest_import(name)
+            if scope_nearest_import is not None:
+                nearest_import = scope_nearest_import
 
             if nearest_import == self:
                 return True
 
+            scope = scope.parent
+
         return False
 
     @property
     def is_duplicate(self) -> bool:
-        return [_import.name for _import in self.imports if not _import.is_type_checking].count(self.name) > 1
-
-    @classmethod
-    def get_unused_imports(cls, *, include_star_import: bool = False) -> typing.Iterator[Import | ImportFrom]:
-        for imp in reversed(Import.imports):
-            if include_star_import and isinstance(imp, ImportFrom) and imp.star:
-                yield imp
-            elif not imp.is_used():
-                yield imp
+        return self.session.import_counts[self.name] > 1
 
     @classmethod
     def register(
-        cls, *, lineno: int, column: int, name: str, package: str, node: ast.Import, is_type_checking: bool = False
+        cls,
+        session: AnalysisSession,
+        *,
+        lineno: int,
+        column: int,
+        name: str,
+        package: str,
+        is_type_checking: bool = False,
     ) -> None:
         _import = cls(lineno, column, name, package)
-        _import.node = node
         _import.is_type_checking = is_type_checking
-        cls.imports.append(_import)
-
-        Scope.register(_import)
+        _import.session = session
+        session.add_import(_import)
 
-    @classmethod
-    def clear(cls):
-        cls.imports.clear()
 
-
-@dataclasses.dataclass
+@dataclasses.dataclass(**SLOTS)
 class ImportFrom(Import):
     star: bool
     suggestions: list[str]
@@ -107,6 +122,7 @@ class ImportFrom(Import):
     @classmethod
     def register(  # type: ignore[override]  # noqa
         cls,
+        session: AnalysisSession,
         *,
         lineno: int,
         column: int,
@@ -114,31 +130,32 @@ class ImportFrom(Import):
         package: str,
         star: bool,
         suggestions: list[str],
-        node: ast.ImportFrom,
         is_type_checking: bool = False,
-    ) -> None:
+    ) -> ImportFrom:
         _import = cls(lineno, column, name, package, star, suggestions)
-        _import.node = node
         _import.is_type_checking = is_type_checking
-        cls.imports.append(_import)
+        _import.session = session
+        session.add_import(_import)
+        return _import
 
-        Scope.register(_import)
 
-
-@dataclasses.dataclass
+@dataclasses.dataclass(**SLOTS)
 class Name:
-    names: typing.ClassVar[list[Name]] = []
-
     lineno: int
     name: str
     is_all: bool = False
 
-    node: ast.Name | ast.Attribute | ast.Constant = dataclasses.field(init=False, repr=False, compare=False)
     match_import: Import | ImportFrom | bool = dataclasses.field(init=False, repr=False, compare=False, default=False)
+    session: AnalysisSession = dataclasses.field(init=False, repr=False, compare=False)
+    scope: Scope = dataclasses.field(init=False, repr=False, compare=False)
+    parts: tuple[str, ...] = dataclasses.field(init=False, repr=False, compare=False)  # the dotted components
+
+    def __post_init__(self) -> None:
+        self.parts = tuple(self.name.split("."))
 
     @property
     def is_attribute(self):
-        return "." in self.name
+        return len(self.parts) > 1
 
     def _is_deferred_usage(self, imp: Import | ImportFrom) -> bool:
         imp_scope = imp.scope
@@ -150,20 +167,13 @@ class Name:
         return False
 
     def _has_more_specific_import(self, imp: Import | ImportFrom) -> bool:
-        name_parts = self.name.split(".")
-        for other_imp in Import.imports:
-            if other_imp is imp:
-                continue
-            other_parts = other_imp.name.split(".")
-            if len(other_parts) <= len(name_parts) and name_parts[: len(other_parts)] == other_parts:
-                return True
-        return False
+        return self.session.import_trie.has_prefix(self.parts, exclude=imp.parts)
 
     def match_2(self, imp: Import | ImportFrom) -> bool:
         if self.is_all:
             is_match = self.name == imp.name
         elif self.is_attribute:
-            primary_match = ".".join(self.name.split(".")[: len(imp)]) == imp.name
+            primary_match = self.parts[: len(imp)] == imp.parts
             sub_match = (
                 not primary_match and imp.is_match_sub_packages(self.name) and not self._has_more_specific_import(imp)
             )
@@ -186,29 +196,28 @@ class Name:
 
         return is_match
 
-    @property
-    def scope(self):
-        return Scope.get_scope_by_current_node(self)
-
     @classmethod
     def register(
-        cls, *, lineno: int, name: str, node: ast.Name | ast.Attribute | ast.Constant, is_all: bool = False
+        cls,
+        session: AnalysisSession,
+        *,
+        lineno: int,
+        name: str,
+        is_all: bool = False,
+        scope: Scope | None = None,
     ) -> None:
         _name = cls(lineno, name, is_all)
-        _name.node = node
-        cls.names.append(_name)
+        _name.session = session
+        session.names.append(_name)
+        session.names_by_head.setdefault(_name.parts[0], []).append(_name)
 
-        Scope.register(_name, is_global=is_all)
-
-    @classmethod
-    def clear(cls) -> None:
-        cls.names.clear()
+        session.register_to_scope(_name, is_global=is_all, scope=scope)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(eq=False, **SLOTS)
 class Scope:
-    scopes: typing.ClassVar[list[Scope]] = []
-    current_scope: typing.ClassVar[list[Scope]] = []
+    """The imports and names of one module, class or function body; there
+    is a single scope per node, so scopes compare by identity."""
 
     node: ast.AST
 
@@ -216,88 +225,225 @@ class Scope:
         default_factory=list, init=False, repr=False, compare=False
     )
     parent: Scope = dataclasses.field(default=None, repr=False)
-    child_scopes: set[Scope] = dataclasses.field(default_factory=set, init=False, repr=False, compare=False)
+    # The imports of the scope by their first dotted component, sorted by line,
+    # column and registration order, and the matching sort keys for bisect.
+    imports_by_head: dict[str, list[Import | ImportFrom]] = dataclasses.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    import_keys: dict[str, list[tuple[int, int, int]]] = dataclasses.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
-    def __hash__(self) -> int:
-        return hash(self.node)
+    def add_import(self, imp: Import | ImportFrom, *, order: int) -> None:
+        head = imp.parts[0]
+        import_keys = self.import_keys.setdefault(head, [])
+        index = bisect.bisect(import_keys, (imp.lineno, imp.column, -order))
+        import_keys.insert(index, (imp.lineno, imp.column, -order))
+        self.imports_by_head.setdefault(head, []).insert(index, imp)
+
+    def get_nearest_import(self, name: Name) -> Import | ImportFrom | None:
+        """Returns the last import of this scope above the line of ``name``
+        that it matches, outside ``TYPE_CHECKING`` blocks; the first one
+        registered if several share a line and column."""
+        head = name.parts[0]
+        import_keys = self.import_keys.get(head)
+        if not import_keys:
+            return None
+
+        imports = self.imports_by_head[head]
+        for index in range(bisect.bisect_left(import_keys, (name.lineno,)) - 1, -1, -1):
+            imp = imports[index]
+            if not imp.is_type_checking and name.match_2(imp):
+                return imp
 
-    @classmethod
-    def get_current_scope(cls) -> Scope:
-        return cls.current_scope[-1]
+        return None
 
-    @classmethod
-    def get_global_scope(cls) -> Scope:
-        global_scope = cls.scopes[0]
-        assert global_scope.parent is None
-        return global_scope
+    def is_within(self, scope: Scope) -> bool:
+        """Whether this scope is ``scope`` or one of its child scopes."""
+        current_scope: Scope | None = self
+        while current_scope is not None:
+            if current_scope is scope:
+                return True
+            current_scope = current_scope.parent
+        return False
 
-    @classmethod
-    def add_global_scope(cls, tree: ast.AST) -> None:
-        parent = None
-        scope = Scope(tree, parent)
-        cls.current_scope.append(scope)
-        cls.scopes.append(scope)  # global scope added to cls.scopes
 
-    @classmethod
-    def add_current_scope(cls, node: ast.AST) -> None:
-        parent = cls.get_current_scope()
-        scope = Scope(node, parent)
-        cls.current_scope.append(scope)
+@dataclasses.dataclass(**SLOTS)
+class NameTable:
+    """The names found in a source, stored in columns with one row per
+    occurrence: the id of the name, its line and the id of its scope.
 
-    @classmethod
-    def remove_current_scope(cls):
-        cls.current_scope.pop()
+    Each distinct dotted name is kept once in ``symbols`` and each scope
+    once in ``scopes``, and the integer columns are arrays, so a row costs
+    a few bytes and no object for the garbage collector to track. Symbols
+    are only deduplicated within the table, not interned for the process,
+    so they are freed along with the analysis.
+    """
 
-    @classmethod
-    def register(cls, current_node: Import | ImportFrom | Name, *, is_global=False) -> None:
-        scope = cls.get_previous_scope(cls.get_global_scope() if is_global else cls.get_current_scope())
+    symbols: list[str] = dataclasses.field(default_factory=list)  # symbol id -> dotted name
+    scopes: list[Scope] = dataclasses.field(default_factory=list, repr=False)  # scope id -> scope
 
-        # current nodes add to scope
-        scope.current_nodes.append(current_node)
+    symbol_column: array.array = dataclasses.field(default_factory=lambda: array.array("I"), repr=False)
+    lineno_column: array.array = dataclasses.field(default_factory=lambda: array.array("I"), repr=False)
+    scope_column: array.array = dataclasses.field(default_factory=lambda: array.array("I"), repr=False)
 
-        # child scopes add to scope
-        if scope.parent is None:
-            return
+    _symbol_ids: dict[str, int] = dataclasses.field(default_factory=dict, init=False, repr=False, compare=False)
+    _scope_ids: dict[Scope, int] = dataclasses.field(default_factory=dict, init=False, repr=False, compare=False)
 
-        parent = cls.get_previous_scope(scope.parent)
-        child_scope = scope
+    def __len__(self) -> int:
+        return len(self.symbol_column)
+
+    def add(self, lineno: int, name: str, scope: Scope) -> None:
+        symbol_id = self._symbol_ids.get(name)
+        if symbol_id is None:
+            symbol_id = self._symbol_ids[name] = len(self.symbols)
+            self.symbols.append(name)
+
+        scope_id = self._scope_ids.get(scope)
+        if scope_id is None:
+            scope_id = self._scope_ids[scope] = len(self.scopes)
+            self.scopes.append(scope)
+
+        self.symbol_column.append(symbol_id)
+        self.lineno_column.append(lineno)
+        self.scope_column.append(scope_id)
+
+    def rows(self, symbol_ids: typing.Container[int] | None = None) -> typing.Iterator[tuple[int, str, Scope]]:
+        """Yields the line, name and scope of each occurrence, only of the
+        given symbols if ``symbol_ids`` is passed."""
+        for symbol_id, lineno, scope_id in zip(self.symbol_column, self.lineno_column, self.scope_column):
+            if symbol_ids is None or symbol_id in symbol_ids:
+                yield lineno, self.symbols[symbol_id], self.scopes[scope_id]
+
+
+@dataclasses.dataclass(**SLOTS)
+class ImportTrie:
+    """The dotted names of the imports of a source, one node per component."""
+
+    children: dict[str, ImportTrie] = dataclasses.field(default_factory=dict)
+    count: int = 0  # imports named by the path to this node
+
+    def add(self, parts: typing.Sequence[str]) -> None:
+        node = self
+        for part in parts:
+            node = node.children.setdefault(part, ImportTrie())
+        node.count += 1
+
+    def has_prefix(self, parts: typing.Sequence[str], *, exclude: typing.Sequence[str]) -> bool:
+        """Whether an import is named by ``parts`` or one of their prefixes,
+        not counting one import named by ``exclude``."""
+        is_exclude_path = True  # the path so far is a prefix of exclude
+
+        node = self
+        for depth, part in enumerate(parts, start=1):
+            child = node.children.get(part)
+            if child is None:
+                return False
+
+            node = child
+            is_exclude_path = is_exclude_path and depth <= len(exclude) and exclude[depth - 1] == part
+            if node.count > (is_exclude_path and depth == len(exclude)):
+                return True
 
-        while parent:
-            parent.child_scopes.add(child_scope)
+        return False
 
-            child_scope = parent
-            if parent.parent is None:
-                break
-            parent = cls.get_previous_scope(parent.parent)
+    def clear(self) -> None:
+        self.children.clear()
+        self.count = 0
 
-    @classmethod
-    def get_scope_by_current_node(cls, current_node: Import | ImportFrom | Name) -> Scope | None:
-        for scope in cls.scopes:
-            if current_node in scope.current_nodes:
-                return scope
 
-        return None
+@dataclasses.dataclass
+class AnalysisSession:
+    """Holds the imports, names and scopes collected while analyzing one
+    source, so separate analyses never share state."""
+
+    imports: list[Import | ImportFrom] = dataclasses.field(default_factory=list)
+    import_counts: collections.Counter[str] = dataclasses.field(default_factory=collections.Counter, repr=False)
+    import_trie: ImportTrie = dataclasses.field(default_factory=ImportTrie, repr=False)
+    names: list[Name] = dataclasses.field(default_factory=list)
+    names_by_head: dict[str, list[Name]] = dataclasses.field(
+        default_factory=dict, repr=False
+    )  # first component -> names
+    scopes: list[Scope] = dataclasses.field(default_factory=list, repr=False)
+    current_scope: list[Scope] = dataclasses.field(default_factory=list, repr=False)
+    scope_index: dict[ast.AST, Scope] = dataclasses.field(default_factory=dict, repr=False)  # node -> its scope
+    profiler: Profiler = dataclasses.field(default_factory=Profiler, repr=False, compare=False)
+
+    def get_current_scope(self) -> Scope:
+        return self.current_scope[-1]
+
+    def get_global_scope(self) -> Scope:
+        global_scope = self.scopes[0]
+        assert global_scope.parent is None
+        return global_scope
 
-    @property
-    def names(self) -> typing.Iterator[Name]:
-        yield from filter(lambda node: isinstance(node, Name), self.current_nodes)  # type: ignore
+    def add_global_scope(self, tree: ast.AST) -> None:
+        parent = None
+        scope = Scope(tree, parent)
+        self.current_scope.append(scope)
+        self.scopes.append(scope)  # global scope added to self.scopes
+        self.scope_index[tree] = scope
 
-        for child_scope in self.child_scopes:
-            yield from child_scope.names
+    def add_current_scope(self, node: ast.AST) -> None:
+        parent = self.get_current_scope()
+        scope = Scope(node, parent)
+        self.current_scope.append(scope)
 
-    @property
-    def imports(self) -> typing.Iterator[Import]:
-        yield from filter(lambda node: isinstance(node, Import), self.current_nodes)  # type: ignore
+    def remove_current_scope(self) -> None:
+        self.current_scope.pop()
 
-    @classmethod
-    def get_previous_scope(cls, scope: Scope) -> Scope:
-        for _scope in cls.scopes:
-            if _scope == scope:
-                return _scope
+    def add_import(self, imp: Import | ImportFrom) -> None:
+        self.imports.append(imp)
+        if not imp.is_type_checking:
+            self.import_counts[imp.name] += 1
+        self.import_trie.add(imp.parts)
 
-        cls.scopes.append(scope)
-        return scope
+        self.register_to_scope(imp)
 
-    @classmethod
-    def clear(cls):
-        cls.scopes.clear()
+    def register_to_scope(
+        self, current_node: Import | ImportFrom | Name, *, is_global=False, scope: Scope | None = None
+    ) -> None:
+        """Adds the node to the given scope, the current scope by default, and
+        makes that scope its owner."""
+        if is_global:
+            scope = self.get_global_scope()
+        elif scope is None:
+            scope = self.get_current_scope()
+        scope = self.get_previous_scope(scope)
+
+        # current nodes add to scope
+        scope.current_nodes.append(current_node)
+        current_node.scope = scope
+        if isinstance(current_node, Import):
+            scope.add_import(current_node, order=len(self.imports))
+
+    def get_previous_scope(self, scope: Scope) -> Scope:
+        """Returns the registered scope of the node of ``scope``, registering
+        ``scope`` if its node has none yet."""
+        previous_scope = self.scope_index.get(scope.node)
+        if previous_scope is None:
+            previous_scope = self.scope_index[scope.node] = scope
+            self.scopes.append(scope)
+        return previous_scope
+
+    def remove_name(self, name: Name) -> None:
+        self.names.remove(name)
+        self.names_by_head[name.parts[0]].remove(name)
+        name.scope.current_nodes.remove(name)
+
+    def get_unused_imports(self, *, include_star_import: bool = False) -> typing.Iterator[Import | ImportFrom]:
+        for imp in reversed(self.imports):
+            if include_star_import and isinstance(imp, ImportFrom) and imp.star:
+                yield imp
+            elif not imp.is_used():
+                yield imp
+
+    def clear(self) -> None:
+        self.imports.clear()
+        self.import_counts.clear()
+        self.import_trie.clear()
+        self.names.clear()
+        self.names_by_head.clear()
+        self.scopes.clear()
+        self.current_scope.clear()
+        self.scope_index.clear()
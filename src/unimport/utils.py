@@ -1,29 +1,41 @@
 from __future__ import annotations
 
+import contextlib
 import difflib
 import importlib.machinery
 import importlib.util
+import io
+import math
+import os
 import re
+import subprocess
 import tokenize
 import typing
 from functools import lru_cache
 from pathlib import Path
 
-from pathspec.patterns import GitWildMatchPattern
-
 import unimport.constants as C
+from unimport.exceptions import GitCommandError
+
+if typing.TYPE_CHECKING:
+    from unimport.gitignore import Gitignore
 
 __all__ = (
     "get_module_dir",
     "get_source",
+    "has_imports",
     "get_spec",
     "is_std",
     "action_to_bool",
-    "get_exclude_list_from_gitignore",
     "read",
     "list_paths",
     "diff",
     "return_exit_code",
+    "cpu_count",
+    "git",
+    "get_changed_paths",
+    "get_git_paths",
+    "read_paths",
 )
 
 
@@ -91,24 +103,6 @@ def action_to_bool(action: str) -> bool:
         raise ValueError(f"invalid truth value {action!r}")
 
 
-def get_exclude_list_from_gitignore(path=Path(".gitignore")) -> list[GitWildMatchPattern]:
-    """Converts .gitignore patterns to regex and return this excludes regex
-    list."""
-
-    if not path.is_file():
-        return []
-
-    gitignore_patterns: list[GitWildMatchPattern] = []
-    source, _, _ = read(path)
-    for line in source.splitlines():
-        regex, include = GitWildMatchPattern.pattern_to_regex(line)
-        if regex:
-            pattern = GitWildMatchPattern(re.compile(regex), include)
-            gitignore_patterns.append(pattern)
-
-    return gitignore_patterns
-
-
 def read(path: Path) -> tuple[str, str, str | None]:
     try:
         with tokenize.open(path) as stream:
@@ -125,29 +119,176 @@ def read(path: Path) -> tuple[str, str, str | None]:
     return source, encoding, newline
 
 
+def has_imports(source: str) -> bool:
+    """Tells whether the source has an import statement other than ``from
+    __future__`` imports, which are never reported.
+
+    A plain substring search rules out most sources; otherwise the tokens
+    confirm it, so ``import`` in strings and comments does not count.
+    Sources that do not tokenize count as having imports, so they are
+    parsed and their errors reported.
+    """
+    if "import" not in source:
+        return False
+
+    before_last = last = ""
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(source).readline):
+            if token.type in (tokenize.NL, tokenize.COMMENT):
+                continue
+            if (
+                token.type == tokenize.NAME
+                and token.string == "import"
+                and (before_last, last) != ("from", "__future__")
+            ):
+                return True
+            before_last, last = last, token.string
+    except (tokenize.TokenError, SyntaxError):
+        return True
+
+    return False
+
+
 def list_paths(
     start: Path,
     *,
     include: str = C.INCLUDE_REGEX_PATTERN,
     exclude: str = C.EXCLUDE_REGEX_PATTERN,
-    gitignore_patterns: list[GitWildMatchPattern] | None = None,
+    gitignore: Gitignore | None = None,
 ) -> typing.Iterator[Path]:
+    """Yields the Python files under ``start`` that match ``include``.
+
+    Directories whose path, followed by a separator, matches ``exclude`` or
+    that are ignored by ``gitignore`` are pruned without being read, and a
+    directory reached again through a symlink is walked only once.
+    """
     include_regex, exclude_regex = re.compile(include), re.compile(exclude)
-    file_names: typing.Iterable[Path] = start.glob(C.GLOB_PATTERN) if start.is_dir() else [start]
-
-    if gitignore_patterns:
-        for file_name in file_names:
-            if include_regex.search(str(file_name)) and not exclude_regex.search(str(file_name)):
-                for gitignore_pattern in gitignore_patterns:
-                    match_file = gitignore_pattern.match_file(str(file_name))
-                    if match_file:
-                        break
-                else:
-                    yield file_name
-    else:
-        for file_name in file_names:
-            if include_regex.search(str(file_name)) and not exclude_regex.search(str(file_name)):
-                yield file_name
+
+    if gitignore is not None and gitignore.is_ignored(start):
+        return
+
+    if not start.is_dir():
+        if include_regex.search(str(start)) and not exclude_regex.search(str(start)):
+            yield start
+        return
+
+    visited: set[tuple[int, int]] = set()
+    with contextlib.suppress(OSError):
+        stat = start.stat()
+        visited.add((stat.st_dev, stat.st_ino))
+
+    directories = [start]
+    while directories:
+        directory = directories.pop()
+        try:
+            with os.scandir(directory) as iterator:
+                entries = list(iterator)
+        except OSError:
+            continue
+
+        is_ignored = gitignore.compile(directory) if gitignore is not None else None
+        subdirectories: list[Path] = []
+        for entry in entries:
+            path = directory / entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+
+            if is_ignored is not None and is_ignored(entry.name, is_dir):
+                continue
+
+            if not is_dir:
+                if (
+                    entry.name.endswith(".py")
+                    and include_regex.search(str(path))
+                    and not exclude_regex.search(str(path))
+                ):
+                    yield path
+            elif not exclude_regex.search(str(path) + os.sep):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+
+                if (stat.st_dev, stat.st_ino) not in visited:  # symlink loops and aliases
+                    visited.add((stat.st_dev, stat.st_ino))
+                    subdirectories.append(path)
+
+        directories.extend(reversed(subdirectories))
+
+
+def git(*args: str) -> list[str]:
+    """Runs a git command in the current directory and returns the NUL
+    separated paths it prints; a failure is reported with the first line
+    of its error."""
+    command = ["git", *args]
+    try:
+        process = subprocess.run(command, capture_output=True, check=True)
+    except FileNotFoundError as exc:
+        raise GitCommandError(" ".join(command), str(exc))
+    except subprocess.CalledProcessError as exc:
+        raise GitCommandError(" ".join(command), os.fsdecode(exc.stderr).strip().partition("\n")[0])
+
+    return [os.fsdecode(path) for path in process.stdout.split(b"\0") if path]
+
+
+def get_changed_paths(ref: str) -> list[Path]:
+    """Returns the Python files under the current directory that differ from
+    ``ref``, staged or not, together with the untracked ones; deleted files
+    are left out."""
+    if ref.startswith("-"):  # git would take it as an option
+        raise GitCommandError(f"git diff {ref}", "a ref cannot start with '-'")
+
+    # Outside a work tree git diff compares files instead and fails with its
+    # whole usage text, so the ref is checked first.
+    try:
+        git("rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}")
+    except GitCommandError as exc:
+        raise GitCommandError(f"git diff {ref}", exc.error or f"unknown commit {ref!r}")
+
+    changed = git("diff", "--name-only", "-z", "--relative", "--diff-filter=d", ref, "--")
+    untracked = git("ls-files", "-z", "--others", "--exclude-standard")
+    return [Path(path) for path in dict.fromkeys(changed + untracked) if path.endswith(".py")]
+
+
+def get_git_paths(sources: typing.Iterable[Path]) -> list[Path]:
+    """Returns the files under ``sources`` that git knows about: the tracked
+    ones that were not deleted and the untracked ones that are not
+    ignored."""
+    pathspecs = ["--", *map(str, sources)]
+    paths = git("--literal-pathspecs", "ls-files", "-z", "--cached", "--others", "--exclude-standard", *pathspecs)
+    deleted = set(git("--literal-pathspecs", "ls-files", "-z", "--deleted", *pathspecs))
+    return [Path(path) for path in dict.fromkeys(paths) if path not in deleted]
+
+
+def read_paths(stream: typing.BinaryIO) -> typing.Iterator[Path]:
+    """Yields the paths of a NUL separated stream, or a newline separated
+    one when a newline arrives before any NUL, as soon as each one arrives."""
+    read = getattr(stream, "read1", stream.read)  # read1 returns what is available without waiting for more
+    separator = None
+    buffer = b""
+    while chunk := read(64 * 1024):
+        buffer += chunk
+        if separator is None:
+            if b"\0" in buffer:
+                separator = b"\0"
+            elif b"\n" in buffer:
+                separator = b"\n"
+            else:  # a chunk can end before the separator of its first path
+                continue
+
+        *lines, buffer = buffer.split(separator)
+        for line in lines:
+            if separator == b"\n":
+                line = line.rstrip(b"\r")
+            if line:
+                yield Path(os.fsdecode(line))
+
+    if separator == b"\n":
+        buffer = buffer.rstrip(b"\r")
+    if buffer:
+        yield Path(os.fsdecode(buffer))
 
 
 def diff(*, source: str, refactor_result: str, fromfile: Path = None) -> tuple[str, ...]:
@@ -178,3 +319,40 @@ def return_exit_code(*, is_unused_imports: bool, is_syntax_error: bool, refactor
         return 1
 
     return 0
+
+
+def cpu_count() -> int:
+    """Returns the number of CPUs this process can actually use.
+
+    The scheduler affinity mask and the Linux cgroup CPU quota are
+    respected, so a container limited to two CPUs on a 32 core host
+    reports two.
+    """
+    try:
+        count = len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover (not available on macOS and Windows)
+        count = os.cpu_count() or 1
+
+    quota = _get_cgroup_cpu_quota()
+    if quota is not None:
+        count = min(count, quota)
+
+    return max(count, 1)
+
+
+def _get_cgroup_cpu_quota() -> int | None:
+    # cgroup v2
+    with contextlib.suppress(OSError, ValueError):
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota == "max":
+            return None
+        return math.ceil(int(quota) / int(period))
+
+    # cgroup v1
+    with contextlib.suppress(OSError, ValueError):
+        quota_us = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us").read_text())
+        period_us = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us").read_text())
+        if quota_us > 0 and period_us > 0:
+            return math.ceil(quota_us / period_us)
+
+    return None
@@ -6,8 +6,6 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
 NAMES: list[Name] = [
-    Name(lineno=3, name="__all__", is_all=False),
-    Name(lineno=8, name="Any", is_all=False),
     Name(lineno=4, name="Test", is_all=True),
     Name(lineno=5, name="Test2", is_all=True),
 ]
@@ -7,8 +7,6 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 NAMES: list[Name] = [
     Name(lineno=6, name="t", is_all=False),
-    Name(lineno=8, name="f", is_all=False),
-    Name(lineno=13, name="print", is_all=False),
     Name(lineno=13, name="t", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
@@ -6,11 +6,8 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
 NAMES: list[Name] = [
-    Name(lineno=3, name="print", is_all=False),
     Name(lineno=3, name="t", is_all=False),
     Name(lineno=9, name="t", is_all=False),
-    Name(lineno=12, name="f", is_all=False),
-    Name(lineno=16, name="print", is_all=False),
     Name(lineno=16, name="t", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
@@ -6,7 +6,6 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
 NAMES: list[Name] = [
-    Name(lineno=13, name="p", is_all=False),
     Name(lineno=13, name="Path", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
@@ -6,9 +6,7 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
 NAMES: list[Name] = [
-    Name(lineno=13, name="p", is_all=False),
     Name(lineno=13, name="Path", is_all=False),
-    Name(lineno=14, name="print", is_all=False),
     Name(lineno=14, name="ll", is_all=False),
     Name(lineno=17, name="e", is_all=False),
 ]
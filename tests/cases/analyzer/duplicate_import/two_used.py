@@ -6,9 +6,7 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
 NAMES: list[Name] = [
-    Name(lineno=12, name="p", is_all=False),
     Name(lineno=12, name="Path", is_all=False),
-    Name(lineno=13, name="print", is_all=False),
     Name(lineno=13, name="ll", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
@@ -5,9 +5,6 @@ from unimport.statement import Import, ImportFrom, Name
 __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
-NAMES: list[Name] = [
-    Name(lineno=3, name="ImportError", is_all=False),
-    Name(lineno=4, name="print", is_all=False),
-]
+NAMES: list[Name] = []
 IMPORTS: list[Union[Import, ImportFrom]] = []
 UNUSED_IMPORTS: list[Union[Import, ImportFrom]] = []
@@ -6,8 +6,6 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
 NAMES: list[Name] = [
-    Name(lineno=1, name="condition", is_all=False),
-    Name(lineno=3, name="condition_2", is_all=False),
     Name(lineno=8, name="ii", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
@@ -12,8 +12,6 @@ NAMES: list[Name] = [
     Name(lineno=11, name="Any", is_all=False),
     Name(lineno=11, name="Any", is_all=False),
     Name(lineno=11, name="Any", is_all=False),
-    Name(lineno=19, name="print", is_all=False),
-    Name(lineno=19, name="ForwardRef", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
     Import(lineno=1, column=1, name="sys", package="sys"),
@@ -5,10 +5,7 @@ from unimport.statement import Import, ImportFrom, Name
 __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
-NAMES: list[Name] = [
-    Name(lineno=4, name="CodeRange", is_all=False),
-    Name(lineno=4, name="PositionProvider", is_all=False),
-]
+NAMES: list[Name] = []
 IMPORTS: list[Union[Import, ImportFrom]] = [
     ImportFrom(
         lineno=1,
@@ -6,7 +6,6 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
 NAMES: list[Name] = [
-    Name(lineno=4, name="print", is_all=False),
     Name(lineno=4, name="defaultdict", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
@@ -6,11 +6,6 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
 NAMES: list[Name] = [
-    Name(lineno=9, name="print", is_all=False),
-    Name(lineno=9, name="match", is_all=False),
-    Name(lineno=10, name="print", is_all=False),
-    Name(lineno=10, name="search", is_all=False),
-    Name(lineno=11, name="print", is_all=False),
     Name(lineno=11, name="JSONEncoder", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
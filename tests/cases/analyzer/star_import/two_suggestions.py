@@ -7,7 +7,6 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 NAMES: list[Name] = [
     Name(lineno=5, name="time", is_all=False),
-    Name(lineno=6, name="path.join", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
     ImportFrom(
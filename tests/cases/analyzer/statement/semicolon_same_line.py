@@ -6,9 +6,7 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
 NAMES: list[Name] = [
-    Name(lineno=1, name="print", is_all=False),
     Name(lineno=1, name="pathlib.Path", is_all=False),
-    Name(lineno=1, name="__file__", is_all=False),
     Name(lineno=2, name="sys.exit", is_all=False),
     Name(lineno=2, name="doctest.testmod", is_all=False),
     Name(lineno=2, name="doctest.ELLIPSIS", is_all=False),
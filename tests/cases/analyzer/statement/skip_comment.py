@@ -0,0 +1,14 @@
+from typing import Union
+
+from unimport.statement import Import, ImportFrom, Name
+
+__all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
+
+
+NAMES: list[Name] = []
+IMPORTS: list[Union[Import, ImportFrom]] = [
+    Import(lineno=11, column=1, name="ast", package="ast"),
+]
+UNUSED_IMPORTS: list[Union[Import, ImportFrom]] = [
+    Import(lineno=11, column=1, name="ast", package="ast"),
+]
@@ -6,9 +6,7 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
 NAMES: list[Name] = [
-    Name(lineno=7, name="test_list", is_all=False),
     Name(lineno=7, name="List", is_all=False),
-    Name(lineno=7, name="str", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
     Import(lineno=1, column=1, name="sys", package="sys"),
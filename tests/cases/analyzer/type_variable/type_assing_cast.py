@@ -7,10 +7,7 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 NAMES: list[Name] = [
     Name(lineno=3, name="TYPE_CHECKING", is_all=False),
-    Name(lineno=7, name="HistoryType", is_all=False),
     Name(lineno=7, name="QtWebKit.QWebHistory", is_all=False),
-    Name(lineno=7, name="cast", is_all=False),
-    Name(lineno=7, name="return_value", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
     ImportFrom(
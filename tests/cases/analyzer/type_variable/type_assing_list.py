@@ -7,7 +7,6 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 NAMES: list[Name] = [
     Name(lineno=3, name="TYPE_CHECKING", is_all=False),
-    Name(lineno=7, name="HistoryType", is_all=False),
     Name(lineno=7, name="QWebHistory", is_all=False),
     Name(lineno=7, name="List", is_all=False),
 ]
@@ -6,7 +6,6 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
 NAMES: list[Name] = [
-    Name(lineno=4, name="list", is_all=False),
     Name(lineno=4, name="List", is_all=False),
     Name(lineno=4, name="Dict", is_all=False),
 ]
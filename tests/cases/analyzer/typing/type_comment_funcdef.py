@@ -6,9 +6,7 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
 NAMES: list[Name] = [
-    Name(lineno=4, name="str", is_all=False),
     Name(lineno=4, name="List", is_all=False),
-    Name(lineno=4, name="str", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
     ImportFrom(
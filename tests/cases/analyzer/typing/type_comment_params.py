@@ -7,7 +7,6 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 NAMES: list[Name] = [
     Name(lineno=5, name="List", is_all=False),
-    Name(lineno=6, name="str", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
     ImportFrom(lineno=1, column=1, name="List", package="typing", star=False, suggestions=[])
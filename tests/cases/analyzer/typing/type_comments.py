@@ -7,12 +7,9 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 NAMES: list[Name] = [
     Name(lineno=6, name="Any", is_all=False),
-    Name(lineno=6, name="str", is_all=False),
     Name(lineno=6, name="Union", is_all=False),
     Name(lineno=6, name="Tuple", is_all=False),
     Name(lineno=6, name="Tuple", is_all=False),
-    Name(lineno=6, name="str", is_all=False),
-    Name(lineno=6, name="str", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
     ImportFrom(lineno=1, column=1, name="Any", package="typing", star=False, suggestions=[]),
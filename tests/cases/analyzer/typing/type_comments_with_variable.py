@@ -7,8 +7,6 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 NAMES: list[Name] = [
     Name(lineno=4, name="List", is_all=False),
-    Name(lineno=4, name="int", is_all=False),
-    Name(lineno=4, name="test_variable", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
     ImportFrom(
@@ -6,10 +6,7 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
 NAMES: list[Name] = [
-    Name(lineno=6, name="Point", is_all=False),
-    Name(lineno=6, name="tuple", is_all=False),
     Name(lineno=6, name="x", is_all=False),
-    Name(lineno=6, name="float", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
     Import(lineno=3, column=1, name="x", package="x"),
@@ -6,7 +6,6 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
 NAMES: list[Name] = [
-    Name(lineno=6, name="print", is_all=False),
     Name(lineno=6, name="os", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
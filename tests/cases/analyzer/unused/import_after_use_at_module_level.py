@@ -6,7 +6,6 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
 NAMES: list[Name] = [
-    Name(lineno=1, name="print", is_all=False),
     Name(lineno=1, name="sys.path", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
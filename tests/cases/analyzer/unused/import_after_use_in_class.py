@@ -6,7 +6,6 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
 NAMES: list[Name] = [
-    Name(lineno=2, name="x", is_all=False),
     Name(lineno=2, name="sys.platform", is_all=False),
 ]
 IMPORTS: list[Union[Import, ImportFrom]] = [
@@ -6,7 +6,6 @@ __all__ = ["NAMES", "IMPORTS", "UNUSED_IMPORTS"]
 
 
 NAMES: list[Name] = [
-    Name(lineno=5, name="print", is_all=False),
     Name(lineno=5, name="datetime.datetime.now", is_all=False),
     Name(lineno=5, name="datetime.datetime", is_all=False),
 ]
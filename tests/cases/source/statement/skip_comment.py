@@ -0,0 +1,11 @@
+import os  # noqa
+import sys  # unimport: skip
+from re import (  # unimport:skip
+    compile,
+    escape,
+)
+from json import (
+    dumps,
+    loads,
+)  # NOQA
+import ast
@@ -8,7 +8,6 @@ import pytest
 from unimport.analyzers import MainAnalyzer
 from unimport.constants import PY310_PLUS, PY312_PLUS, PY313_PLUS, PY314_PLUS  # noqa using eval expression
 from unimport.refactor import refactor_string
-from unimport.statement import Import, Name
 from unimport.utils import list_paths
 
 
@@ -41,10 +40,10 @@ def test_cases(path: Path, logger):
         pytest.mark.skipif(False, reason, allow_module_level=True)
 
     with contextlib.suppress(SyntaxError):
-        with MainAnalyzer(source=source, include_star_import=True):
-            assert Name.names == analyzer.NAMES
-            assert Import.imports == analyzer.IMPORTS
-            assert list(Import.get_unused_imports()) == analyzer.UNUSED_IMPORTS
+        with MainAnalyzer(source=source, include_star_import=True) as main_analyzer:
+            assert main_analyzer.session.names == analyzer.NAMES
+            assert main_analyzer.session.imports == analyzer.IMPORTS
+            assert list(main_analyzer.session.get_unused_imports()) == analyzer.UNUSED_IMPORTS
 
     # refactor tests
     refactor = refactor_string(source, analyzer.UNUSED_IMPORTS)
@@ -1,4 +1,5 @@
 import argparse
+from pathlib import Path
 
 import pytest
 
@@ -92,3 +93,60 @@ def test_add_permission_option(parser: argparse.ArgumentParser):
     assert vars(parser.parse_args([])) == dict(permission=False)
     assert vars(parser.parse_args(["-p"])) == dict(permission=True)
     assert vars(parser.parse_args(["--permission"])) == dict(permission=True)
+
+
+def test_add_jobs_option(parser: argparse.ArgumentParser):
+    options.add_jobs_option(parser)
+
+    assert vars(parser.parse_args([])) == dict(jobs=None)
+    assert vars(parser.parse_args(["-j", "4"])) == dict(jobs=4)
+    assert vars(parser.parse_args(["--jobs", "1"])) == dict(jobs=1)
+
+
+def test_add_cache_dir_option(parser: argparse.ArgumentParser):
+    options.add_cache_dir_option(parser)
+
+    assert vars(parser.parse_args([])) == dict(cache_dir=None)
+    assert vars(parser.parse_args(["--cache-dir", ".unimport_cache"])) == dict(cache_dir=Path(".unimport_cache"))
+
+
+def test_add_changed_since_option(parser: argparse.ArgumentParser):
+    options.add_changed_since_option(parser)
+
+    assert vars(parser.parse_args([])) == dict(changed_since=None)
+    assert vars(parser.parse_args(["--changed-since", "origin/main"])) == dict(changed_since="origin/main")
+
+
+def test_add_git_files_option(parser: argparse.ArgumentParser):
+    options.add_git_files_option(parser)
+
+    assert vars(parser.parse_args([])) == dict(git_files=False)
+    assert vars(parser.parse_args(["--git-files"])) == dict(git_files=True)
+
+
+def test_add_files_from_option(parser: argparse.ArgumentParser):
+    options.add_files_from_option(parser)
+
+    assert vars(parser.parse_args([])) == dict(files_from=None)
+    assert vars(parser.parse_args(["--files-from", "-"])) == dict(files_from=Path("-"))
+
+
+def test_add_profile_option(parser: argparse.ArgumentParser):
+    options.add_profile_option(parser)
+
+    assert vars(parser.parse_args([])) == dict(profile=False)
+    assert vars(parser.parse_args(["--profile"])) == dict(profile=True)
+
+
+def test_add_profile_slowest_option(parser: argparse.ArgumentParser):
+    options.add_profile_slowest_option(parser)
+
+    assert vars(parser.parse_args([])) == dict(profile_slowest=10)
+    assert vars(parser.parse_args(["--profile-slowest", "3"])) == dict(profile_slowest=3)
+
+
+def test_add_trace_out_option(parser: argparse.ArgumentParser):
+    options.add_trace_out_option(parser)
+
+    assert vars(parser.parse_args([])) == dict(trace_out=None)
+    assert vars(parser.parse_args(["--trace-out", "trace.json"])) == dict(trace_out=Path("trace.json"))
@@ -26,6 +26,13 @@ def test_generate_parser_argument_parser(parser: argparse.ArgumentParser):
 
 def test_generate_parser_empty_parse_args(parser: argparse.ArgumentParser):
     assert vars(parser.parse_args(["--disable-auto-discovery-config", "--color", "never"])) == dict(
+        cache_dir=None,
+        changed_since=None,
+        git_files=False,
+        files_from=None,
+        profile=False,
+        profile_slowest=10,
+        trace_out=None,
         check=False,
         color="never",
         config=None,
@@ -36,7 +43,34 @@ def test_generate_parser_empty_parse_args(parser: argparse.ArgumentParser):
         ignore_init=False,
         include="\\.(py)$",
         include_star_import=False,
+        jobs=None,
         permission=False,
         remove=False,
         sources=[Path(".")],
     )
+
+
+@pytest.mark.parametrize("jobs", ["0", "-1", "two"])
+def test_generate_parser_rejects_non_positive_jobs(parser: argparse.ArgumentParser, jobs: str, capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        parser.parse_args(["--jobs", jobs])
+
+    assert exc_info.value.code == 2
+    assert f"argument -j/--jobs: must be a positive integer, got '{jobs}'" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("profile_slowest", ["0", "-3", "three"])
+def test_generate_parser_rejects_non_positive_profile_slowest(
+    parser: argparse.ArgumentParser, profile_slowest: str, capsys
+):
+    with pytest.raises(SystemExit) as exc_info:
+        parser.parse_args(["--profile-slowest", profile_slowest])
+
+    assert exc_info.value.code == 2
+    assert f"argument --profile-slowest: must be a positive integer, got '{profile_slowest}'" in capsys.readouterr().err
+
+
+def test_generate_parser_profile_before_sources(parser: argparse.ArgumentParser):
+    args = parser.parse_args(["--profile", "src/unimport/utils.py", "--check"])
+
+    assert (args.profile, args.sources, args.check) == (True, [Path("src/unimport/utils.py")], True)
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import io
 import re
 from pathlib import Path
 
 import pytest
 
+from tests.utils import git, write_files
 from unimport import constants as C
+from unimport import utils
 from unimport.commands import generate_parser
 from unimport.config import Config, ParseConfig
 from unimport.exceptions import UnknownConfigKeyException
@@ -91,6 +94,14 @@ def test_parse_config_parse_args_config_setup_cfg():
         (["--permission"], True, "permission"),
         (["--check"], True, "check"),
         (["--ignore-init"], True, "ignore_init"),
+        (["--jobs", "3"], 3, "jobs"),
+        (["--cache-dir", ".cache"], Path(".cache"), "cache_dir"),
+        (["--changed-since", "main"], "main", "changed_since"),
+        (["--git-files"], True, "git_files"),
+        (["--files-from", "-"], Path("-"), "files_from"),
+        (["--profile"], True, "profile"),
+        (["--profile-slowest", "3"], 3, "profile_slowest"),
+        (["--trace-out", "trace.json"], Path("trace.json"), "trace_out"),
     ],
 )
 def test_parse_config_parse_args(argv: list[str], expected_argv: str, attribute_name: str):
@@ -127,6 +138,12 @@ def test_config_build_default_command_diff():
     assert Config.build(args={"permission": True}).diff is True
 
 
+def test_config_build_default_jobs():
+    assert Config.build().jobs == utils.cpu_count()
+    assert Config.build(args={"jobs": 2}).jobs == 2
+    assert Config.build(args={"jobs": -1}).jobs == utils.cpu_count()
+
+
 def test_config_build_command_ignore_init():
     config = Config.build()
 
@@ -261,3 +278,74 @@ def test_like_commands_config_file():
 
     parsed_config = ParseConfig(config_file=pyproject_config_file).parse()
     assert parsed_config == {"ignore_init": True, "include_star_import": True}
+
+
+def test_get_paths_changed_since(git_repository: Path):
+    write_files(git_repository, {"a.py": "", "src/b.py": "", "src/c.py": "", "src/tests/d.py": ""})
+    git("add", ".")
+    git("commit", "-q", "-m", "initial")
+    write_files(git_repository, {"a.py": "import os", "src/b.py": "import os", "src/tests/d.py": "import os"})
+    write_files(git_repository, {"src/e.py": "import os"})
+
+    config = Config(sources=[Path("src")], changed_since="HEAD", exclude="tests/")
+
+    assert sorted(config.get_paths()) == [Path("src/b.py"), Path("src/e.py")]
+
+
+def test_get_paths_overlapping_sources(tmp_path: Path):
+    write_files(tmp_path, {"a.py": "", "pkg/b.py": "", "pkg/sub/c.py": ""})
+
+    config = Config(sources=[tmp_path / "pkg", tmp_path, tmp_path / "pkg" / "sub" / "c.py"])
+
+    assert sorted(path.relative_to(tmp_path) for path in config.get_paths()) == [
+        Path("a.py"),
+        Path("pkg/b.py"),
+        Path("pkg/sub/c.py"),
+    ]
+
+
+def test_get_paths_git_files(git_repository: Path):
+    write_files(
+        git_repository,
+        {".gitignore": "ignored/\n", "a.py": "", "src/b.py": "", "src/c.py": "", "src/d.txt": "", "src/tests/e.py": ""},
+    )
+    git("add", ".")
+    git("commit", "-q", "-m", "initial")
+    write_files(git_repository, {"src/f.py": "", "ignored/g.py": ""})
+    (git_repository / "src" / "c.py").unlink()
+
+    config = Config(sources=[Path("src")], git_files=True, exclude="tests/")
+
+    assert sorted(config.get_paths()) == [Path("src/b.py"), Path("src/f.py")]
+
+
+def test_get_paths_git_files_outside_work_tree(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_files(tmp_path, {"a.py": "", "b/c.py": ""})
+
+    config = Config(git_files=True)
+
+    assert sorted(config.get_paths()) == [Path("a.py"), Path("b/c.py")]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"a.py\nb/c.py\nd.txt\nb/tests/e.py\n",
+        b"a.py\r\nb/c.py\r\n\r\nd.txt\r\nb/tests/e.py",
+        b"a.py\0b/c.py\0d.txt\0b/tests/e.py\0",
+    ],
+)
+def test_get_paths_files_from(tmp_path: Path, content: bytes):
+    files_from = tmp_path / "files"
+    files_from.write_bytes(content)
+
+    config = Config(sources=[Path("ignored")], files_from=files_from, exclude="tests/")
+
+    assert list(config.get_paths()) == [Path("a.py"), Path("b/c.py")]
+
+
+def test_get_paths_files_from_stdin(monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(b"a.py\0b c.py\nd.py\0")))
+
+    assert list(Config(files_from=Path("-")).get_paths()) == [Path("a.py"), Path("b c.py\nd.py")]
@@ -1,4 +1,5 @@
 import os
+import shutil
 from pathlib import Path
 
 import pytest
@@ -20,6 +21,22 @@ def logger():
     return logger
 
 
+@pytest.fixture()
+def git_repository(tmp_path: Path, monkeypatch) -> Path:
+    """An empty git work tree as the current working directory."""
+    from tests.utils import git
+
+    if shutil.which("git") is None:
+        pytest.skip("git is not installed")
+
+    monkeypatch.chdir(tmp_path)
+    git("init", "-q")
+    git("config", "user.email", "unimport@example.com")
+    git("config", "user.name", "unimport")
+    git("config", "commit.gpgsign", "false")
+    return tmp_path
+
+
 def pytest_configure(config):
     config.addinivalue_line("markers", "change_directory(path:str): mark test to change working directory")
 
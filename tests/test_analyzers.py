@@ -0,0 +1,224 @@
+import ast
+import tokenize
+from concurrent.futures import ThreadPoolExecutor
+from textwrap import dedent
+from unittest import mock
+
+from unimport.analyzers import MainAnalyzer
+from unimport.analyzers.decarators import get_skip_comment_lines
+from unimport.analyzers.tree import parse_string
+
+
+def get_unused_import_names(source: str) -> list[str]:
+    with MainAnalyzer(source=source) as analyzer:
+        return [imp.name for imp in analyzer.session.get_unused_imports()]
+
+
+def test_analyzers_do_not_share_state():
+    with MainAnalyzer(source="import os\n") as first, MainAnalyzer(source="import sys\n\nsys.exit()\n") as second:
+        assert [imp.name for imp in first.session.imports] == ["os"]
+        assert [imp.name for imp in second.session.imports] == ["sys"]
+        assert [imp.name for imp in first.session.get_unused_imports()] == ["os"]
+        assert list(second.session.get_unused_imports()) == []
+
+
+def test_analyzers_run_concurrently_in_threads():
+    sources = [
+        dedent(
+            f"""\
+            import os
+            import sys
+
+
+            def func_{index}():
+                import re
+
+                return sys.argv[{index}]
+            """
+        )
+        for index in range(64)
+    ]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(get_unused_import_names, sources))
+
+    assert results == [["re", "os"]] * len(sources)
+
+
+def test_star_import_suggestions_use_names_defined_later():
+    source = dedent(
+        """\
+        from os import *
+
+        def func():
+            return path.join(sep, "a")
+
+        __all__ = ["getcwd"]
+        """
+    )
+    with MainAnalyzer(source=source, include_star_import=True) as analyzer:
+        assert [imp.suggestions for imp in analyzer.session.imports] == [["getcwd", "path", "sep"]]
+
+
+def test_string_annotation_names_are_not_defined_names():
+    source = dedent(
+        """\
+        from os import *
+
+        x: "(path := 1)" = 1
+        sep = 1
+        """
+    )
+    with MainAnalyzer(source=source, include_star_import=True) as analyzer:
+        assert analyzer.session.names == []  # no name matches an import
+        assert [imp.suggestions for imp in analyzer.session.imports] == [["path"]]
+
+
+def test_tree_is_not_annotated_with_parents():
+    source = dedent(
+        """\
+        import typing
+
+        def func(a: "typing.List[int]") -> "typing.Dict":
+            x: "typing.Set" = typing.cast("typing.Any", a)
+        """
+    )
+    with MainAnalyzer(source=source) as analyzer:
+        assert [name.name for name in analyzer.session.names] == [
+            "typing.List",
+            "typing.Set",
+            "typing.Any",
+            "typing.cast",
+            "typing.Any",
+            "typing.Dict",
+        ]
+        assert not any(hasattr(node, "parent") for node in ast.walk(analyzer.session.get_global_scope().node))
+
+
+def test_skip_comment_inside_string_does_not_skip_import():
+    source = dedent(
+        """\
+        import os; value = "# noqa"
+        import sys  # noqa
+        """
+    )
+    assert get_unused_import_names(source) == ["os"]
+
+
+def test_skip_comment_lines_tokenize_only_candidate_sources(monkeypatch):
+    assert get_skip_comment_lines('import os  # noqa\nx = "# unimport: skip"\n') == [1]
+
+    monkeypatch.setattr(tokenize, "generate_tokens", mock.Mock(side_effect=AssertionError))
+    assert get_skip_comment_lines("import os\n# a comment\n") == []
+
+
+def test_attribute_chains_register_each_dotted_name_once():
+    source = dedent(
+        """\
+        import a, i, x
+
+        a.b.c.d
+        a.b().c.d
+        x[i].y.z
+        "{}".format
+        """
+    )
+    with MainAnalyzer(source=source) as analyzer:
+        assert [name.name for name in analyzer.session.names] == ["a.b.c.d", "a.b.c", "a.b", "a.b", "x", "i"]
+
+
+def test_string_annotations_are_parsed_once():
+    source = dedent(
+        """\
+        from typing import List
+
+        a: "List[int]"
+        b = []  # type: List[int]
+        c: "List[int]"
+        """
+    )
+    parse_string.cache_clear()
+    with MainAnalyzer(source=source) as analyzer:
+        assert [(name.lineno, name.name) for name in analyzer.session.names] == [(3, "List"), (4, "List"), (5, "List")]
+    assert parse_string.cache_info().misses == 1
+
+
+def test_only_names_that_can_match_an_import_are_registered():
+    source = dedent(
+        """\
+        import typing
+
+        def func(self):
+            return self.value, os.sep, typing.TYPE_CHECKING
+
+        TYPE_CHECKING = False
+        import os
+        """
+    )
+    with MainAnalyzer(source=source) as analyzer:
+        assert [name.name for name in analyzer.session.names] == ["os.sep", "typing.TYPE_CHECKING", "TYPE_CHECKING"]
+        assert list(analyzer.session.get_unused_imports()) == []
+
+
+def test_imports_and_names_reference_their_scope():
+    source = dedent(
+        """\
+        import os
+
+        def func():
+            import os
+            return os
+
+        class Class:
+            def method(self):
+                return os
+        """
+    )
+    with MainAnalyzer(source=source) as analyzer:
+        scopes = {getattr(scope.node, "name", None): scope for scope in analyzer.session.scopes}
+        assert [imp.scope for imp in analyzer.session.imports] == [scopes[None], scopes["func"]]
+        assert [name.scope for name in analyzer.session.names] == [scopes["func"], scopes["method"]]
+        assert scopes["method"].parent.node.name == "Class"
+        assert "Class" not in scopes  # holds no import or name
+        assert analyzer.session.scope_index == {scope.node: scope for scope in analyzer.session.scopes}
+        assert list(analyzer.session.get_unused_imports()) == []
+
+
+def test_names_are_indexed_by_their_first_component():
+    source = dedent(
+        """\
+        import os, os.path, sys
+
+        def func():
+            import sys
+            return os.path.join, sys.argv
+
+        os.sep
+        """
+    )
+    with MainAnalyzer(source=source) as analyzer:
+        names_by_head = analyzer.session.names_by_head
+        assert {head: [name.name for name in names] for head, names in names_by_head.items()} == {
+            "os": ["os.path.join", "os.path", "os.sep"],
+            "sys": ["sys.argv"],
+        }
+        assert [imp.name for imp in analyzer.session.get_unused_imports()] == ["sys"]
+
+
+def test_duplicate_imports_resolve_to_the_nearest_import_above():
+    source = dedent(
+        """\
+        import os
+        os.sep
+        import os
+
+        def func():
+            import os
+            return os.sep
+
+        import os
+        os.path
+        """
+    )
+    with MainAnalyzer(source=source) as analyzer:
+        assert analyzer.session.import_counts == {"os": 4}
+        assert [imp.lineno for imp in analyzer.session.get_unused_imports()] == [3]
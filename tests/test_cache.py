@@ -0,0 +1,185 @@
+import os
+from pathlib import Path
+from textwrap import dedent
+
+from tests.utils import reopenable_temp_file
+from unimport.cache import Cache, Manifest
+from unimport.main import Main
+from unimport.statement import Import, ImportFrom
+
+
+def test_key():
+    key = Cache.key("import os", include_star_import=False)
+
+    assert key == Cache.key("import os", include_star_import=False)
+    assert key != Cache.key("import sys", include_star_import=False)
+    assert key != Cache.key("import os", include_star_import=True)
+
+
+def test_set_get(tmp_path: Path):
+    cache = Cache(tmp_path)
+    key = Cache.key("import os")
+
+    assert cache.get(key) is None
+
+    cache.set(key, {"unused_imports": []})
+    assert cache.get(key) == {"unused_imports": []}
+    assert [path.name for path in tmp_path.glob("*/*")] == [f"{key}.json"]
+
+
+def test_get_corrupt_entry(tmp_path: Path):
+    cache = Cache(tmp_path)
+    key = Cache.key("import os")
+    cache.get_path(key).parent.mkdir()
+    cache.get_path(key).write_text("{")
+
+    assert cache.get(key) is None
+    assert not cache.get_path(key).exists()
+
+
+def test_evict(tmp_path: Path):
+    cache = Cache(tmp_path, max_size=100)
+    keys = [Cache.key(f"import module_{index}") for index in range(10)]
+    for index, key in enumerate(keys):
+        cache.set(key, {"unused_imports": [], "padding": "x" * 20})
+        os.utime(cache.get_path(key), ns=(index, index))
+
+    cache.get(keys[0])  # recently used entries survive
+    cache.evict()
+
+    remaining = {path.stem for path in tmp_path.glob("*/*.json")}
+    assert sum(path.stat().st_size for path in tmp_path.glob("*/*.json")) <= 100
+    assert keys[0] in remaining
+    assert keys[1] not in remaining
+
+
+def test_evict_manifest(tmp_path: Path):
+    cache = Cache(tmp_path, max_size=100)
+    key = Cache.key("import os")
+    cache.set(key, {"unused_imports": [], "padding": "x" * 20})
+    manifest_path = cache.get_manifest_path(include_star_import=False)
+    manifest_path.write_text("{}" + " " * 100)
+    os.utime(manifest_path, ns=(0, 0))
+
+    cache.evict()
+
+    assert not manifest_path.exists()
+    assert cache.get_path(key).exists()
+
+
+def test_evict_temp_files(tmp_path: Path):
+    cache = Cache(tmp_path)
+    stale, fresh = tmp_path / "ab" / "stale.tmp", tmp_path / "fresh.tmp"
+    stale.parent.mkdir()
+    stale.write_text("{")
+    fresh.write_text("{")
+    os.utime(stale, ns=(0, 0))
+
+    cache.evict()
+
+    assert not stale.exists()
+    assert fresh.exists()  # may still be written by a concurrent run
+
+
+def test_dump_load_imports():
+    imports = [
+        Import(lineno=1, column=1, name="os", package="os"),
+        ImportFrom(lineno=2, column=1, name="path", package="os", star=False, suggestions=[]),
+    ]
+
+    assert Cache.load_imports(Cache.dump_imports(imports)) == imports
+
+
+def test_main_run_with_cache(tmp_path: Path, capsys):
+    source = dedent(
+        """\
+        import os
+        import sys
+
+        print(sys.executable)
+        """
+    )
+    argv = ["--disable-auto-discovery-config", "--check", "--diff", "--cache-dir", tmp_path.as_posix()]
+    with reopenable_temp_file(source) as temp_file:
+        cold = Main.run([*argv, temp_file.as_posix()])
+        cold_output = capsys.readouterr()
+        warm = Main.run([*argv, temp_file.as_posix()])
+        warm_output = capsys.readouterr()
+
+    assert (cold.cache.hits, cold.cache.misses) == (0, 1)
+    assert (warm.cache.hits, warm.cache.misses) == (1, 0)
+    assert cold_output.out == warm_output.out
+    assert f"os at {temp_file.as_posix()}:1" in warm_output.out
+    assert warm_output.err == "Cache: 1 hits (0 without reading the file), 0 misses\n"
+    assert warm.exit_code() == cold.exit_code() == 1
+
+
+def test_manifest(tmp_path: Path):
+    path = tmp_path / "module.py"
+    path.write_text("import os\n")
+    os.utime(path, ns=(0, 0))
+    stat = Manifest.get_stat(path)
+
+    manifest = Manifest(tmp_path / "manifest.json")
+    assert manifest.get(path, stat) is None
+
+    manifest.set(path, stat, unused_imports=[], syntax_error=None)
+    manifest.save()
+
+    manifest = Manifest.load(tmp_path / "manifest.json")
+    assert manifest.get(path, Manifest.get_stat(path)) == {"stat": stat, "unused_imports": [], "syntax_error": None}
+
+    path.write_text("import re\n")
+    assert manifest.get(path, Manifest.get_stat(path)) is None
+
+
+def test_manifest_save_drops_missing_files(tmp_path: Path):
+    paths = [tmp_path / "a.py", tmp_path / "b.py"]
+    manifest = Manifest(tmp_path / "manifest.json")
+    for path in paths:
+        path.write_text("import os\n")
+        manifest.set(path, Manifest.get_stat(path), unused_imports=[], syntax_error=None)
+    paths[0].unlink()
+
+    manifest.save()
+
+    assert list(Manifest.load(tmp_path / "manifest.json").entries) == [str(paths[1])]
+
+
+def test_manifest_racy_entry(tmp_path: Path):
+    path = tmp_path / "module.py"
+    path.write_text("import os\n")
+    stat = Manifest.get_stat(path)
+
+    manifest = Manifest(tmp_path / "manifest.json")
+    manifest.set(path, stat, unused_imports=[], syntax_error=None)
+
+    # Read right after it was written, a same sized write may keep the mtime.
+    assert manifest.get(path, stat) is None
+
+
+def test_main_run_with_manifest(tmp_path: Path, capsys):
+    source = dedent(
+        """\
+        import sys
+
+        print(sys.executable)
+        """
+    )
+    argv = ["--disable-auto-discovery-config", "--check", "--cache-dir", (tmp_path / "cache").as_posix()]
+    path = tmp_path / "module.py"
+    path.write_text(source)
+    os.utime(path, ns=(0, 0))
+
+    cold = Main.run([*argv, path.as_posix()])
+    warm = Main.run([*argv, path.as_posix()])
+    capsys.readouterr()
+
+    assert (cold.cache.hits, cold.cache.unread, cold.cache.misses) == (0, 0, 1)
+    assert (warm.cache.hits, warm.cache.unread, warm.cache.misses) == (1, 1, 0)
+
+    path.write_text(source.replace("sys", "os"))
+    changed = Main.run([*argv, path.as_posix()])
+    capsys.readouterr()
+
+    assert (changed.cache.hits, changed.cache.unread, changed.cache.misses) == (0, 0, 1)
@@ -0,0 +1,76 @@
+import textwrap
+from pathlib import Path
+
+from tests.utils import write_files
+from unimport.gitignore import Gitignore
+from unimport.utils import list_paths
+
+
+def get_paths(root: Path, gitignore: Gitignore) -> list[Path]:
+    return sorted(path.relative_to(root) for path in list_paths(root, gitignore=gitignore))
+
+
+def test_gitignore(tmp_path: Path):
+    gitignore = textwrap.dedent(
+        """\
+        a
+        b
+        spam/**
+        **/api/
+        **/tests
+        **/
+        """
+    )
+    write_files(tmp_path, {".gitignore": gitignore, "a": "", "b/c.py": "", "spam/d.py": "", "pkg/e.py": "", "f.py": ""})
+
+    assert get_paths(tmp_path, Gitignore(str(tmp_path))) == [Path("f.py")]
+
+
+def test_gitignore_negation(tmp_path: Path):
+    gitignore = textwrap.dedent(
+        """\
+        *.py
+        !keep.py
+        generated/
+        !generated/keep.py
+        """
+    )
+    write_files(tmp_path, {".gitignore": gitignore, "a.py": "", "keep.py": "", "generated/keep.py": ""})
+
+    assert get_paths(tmp_path, Gitignore(str(tmp_path))) == [Path("keep.py")]
+
+
+def test_gitignore_nested(tmp_path: Path):
+    write_files(
+        tmp_path,
+        {
+            ".gitignore": "*_pb2.py\n",
+            "a_pb2.py": "",
+            "pkg/.gitignore": "!*_pb2.py\n/local.py\n",
+            "pkg/b_pb2.py": "",
+            "pkg/local.py": "",
+            "pkg/sub/local.py": "",
+            "other/local.py": "",
+        },
+    )
+    gitignore = Gitignore(str(tmp_path))
+
+    assert get_paths(tmp_path, gitignore) == [Path("other/local.py"), Path("pkg/b_pb2.py"), Path("pkg/sub/local.py")]
+    assert list(list_paths(tmp_path / "pkg" / "local.py", gitignore=gitignore)) == []
+
+
+def test_gitignore_info_exclude(tmp_path: Path, monkeypatch):
+    write_files(tmp_path, {".git/info/exclude": "scratch/\n", "scratch/a.py": "", "b.py": ""})
+    monkeypatch.chdir(tmp_path / "scratch")
+
+    gitignore = Gitignore.discover()
+
+    assert gitignore == Gitignore(str(tmp_path), str(tmp_path / ".git" / "info" / "exclude"))
+    assert get_paths(tmp_path, gitignore) == [Path("b.py")]
+    assert list(list_paths(Path("."), gitignore=gitignore)) == []
+
+
+def test_gitignore_outside_root(tmp_path: Path):
+    write_files(tmp_path, {"root/.gitignore": "*.py\n", "a.py": ""})
+
+    assert get_paths(tmp_path, Gitignore(str(tmp_path / "root"))) == [Path("a.py")]
@@ -1,3 +1,6 @@
+import contextlib
+import functools
+import sys
 from textwrap import dedent
 from unittest import mock
 
@@ -5,7 +8,7 @@ import pytest
 
 from tests.utils import reopenable_temp_file
 from unimport.config import Config
-from unimport.main import Main
+from unimport.main import Main, _analyze
 
 
 def test_empty_main():
@@ -93,3 +96,75 @@ def test_commands_in_run(mock_permission):
 
     assert main.config.remove is False
     assert main.config.permission is True
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_main_run_jobs(jobs, capsys, monkeypatch):
+    monkeypatch.setattr("unimport.main.FILES_PER_JOB", 1)
+    sources = [
+        "import os\n",
+        "import sys\n\nprint(sys.executable)\n",
+        "import re\nimport json\n",
+    ]
+    with contextlib.ExitStack() as stack:
+        paths = [stack.enter_context(reopenable_temp_file(source)).as_posix() for source in sources]
+        main = Main.run(["--disable-auto-discovery-config", "--check", "--jobs", jobs, *paths])
+
+    assert main.config.jobs == int(jobs)
+    assert main.is_unused_imports is True
+    assert main.exit_code() == 1
+    assert capsys.readouterr().out.splitlines() == [
+        f"os at {paths[0]}:1",
+        f"json at {paths[2]}:2",
+        f"re at {paths[2]}:1",
+    ]
+
+
+def test_main_run_jobs_few_files(capsys, monkeypatch):
+    monkeypatch.setattr("unimport.main.ProcessPoolExecutor", mock.Mock(side_effect=AssertionError))
+    with reopenable_temp_file("import os\n") as a, reopenable_temp_file("import sys\n") as b:
+        main = Main.run(["--disable-auto-discovery-config", "--check", "--jobs", "8", a.as_posix(), b.as_posix()])
+
+    assert main.exit_code() == 1
+    assert capsys.readouterr().out.splitlines() == [f"os at {a.as_posix()}:1", f"sys at {b.as_posix()}:1"]
+
+
+def test_main_map_reads_paths_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr("unimport.main.FILES_PER_JOB", 2)
+    paths = [tmp_path / f"{index}.py" for index in range(20)]
+    for path in paths:
+        path.write_text("import os\n")
+    read_paths = []
+
+    def get_paths():
+        for path in paths:
+            read_paths.append(path)
+            yield path
+
+    main = Main(["--disable-auto-discovery-config", "--check", "--jobs", "2"])
+    analyze = functools.partial(_analyze, include_star_import=False, refactor=False)
+    results = main._map(analyze, get_paths(), refactor=False)
+
+    assert next(results).path == paths[0]
+    assert len(read_paths) < len(paths)
+    assert [result.path for result in results] == paths[1:]
+
+
+def test_main_reports_git_errors(git_repository, monkeypatch, capsys):
+    from unimport.__main__ import main
+
+    monkeypatch.setattr(sys, "argv", ["unimport", "--disable-auto-discovery-config", "--changed-since", "nosuchref"])
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 1
+    assert capsys.readouterr().err == "Git command 'git diff nosuchref' failed: unknown commit 'nosuchref'\n"
+
+
+def test_main_reports_syntax_error_in_import_free_file(capsys):
+    with reopenable_temp_file("def f(:\n    pass\n") as temp_file:
+        main = Main.run(["--disable-auto-discovery-config", "--check", temp_file.as_posix()])
+
+    assert main.is_syntax_error is True
+    assert main.exit_code() == 1
+    assert capsys.readouterr().out.endswith(f" at {temp_file.as_posix()}\n")
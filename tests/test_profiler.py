@@ -0,0 +1,183 @@
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from tests.utils import write_files
+from unimport.analyzers import MainAnalyzer
+from unimport.main import Main
+from unimport.profiler import Profiler
+
+
+def test_disabled_profiler():
+    profiler = Profiler()
+
+    with profiler.span("parse"):
+        profiler.count(names=1)
+
+    assert profiler.spans == []
+    assert profiler.counters == {}
+
+
+def test_span():
+    profiler = Profiler(enabled=True, path="a.py")
+
+    with profiler.span("imports"):
+        with profiler.span("star imports"):
+            pass
+    with profiler.span("diff", "b.py"):
+        pass
+
+    assert [(span.name, span.path, span.depth) for span in profiler.spans] == [
+        ("star imports", "a.py", 1),
+        ("imports", "a.py", 0),
+        ("diff", "b.py", 0),
+    ]
+    assert profiler.spans[1].start <= profiler.spans[0].start
+    assert profiler.spans[1].wall >= profiler.spans[0].wall
+
+
+def test_span_exception():
+    profiler = Profiler(enabled=True)
+
+    with pytest.raises(SyntaxError):
+        with profiler.span("parse"):
+            raise SyntaxError
+
+    with profiler.span("names"):
+        pass
+
+    assert [(span.name, span.depth) for span in profiler.spans] == [("parse", 0), ("names", 0)]
+
+
+def test_iterate():
+    profiler = Profiler(enabled=True)
+
+    assert list(profiler.iterate("discover", [Path("a.py"), Path("b.py")])) == [Path("a.py"), Path("b.py")]
+    assert [span.name for span in profiler.spans] == ["discover"] * 3
+
+
+def test_main_analyzer_spans():
+    profiler = Profiler(enabled=True, path="a.py")
+    source = "from os import *\nimport sys\n\ndef f():\n    return path, sys.argv\n"
+
+    with MainAnalyzer(source=source, include_star_import=True, profiler=profiler):
+        pass
+
+    assert [span.name for span in profiler.spans] == ["parse", "star imports", "traverse"]
+    assert profiler.counters == {"a.py": {"names": 1, "scopes": 2, "imports": 2}}
+
+
+def test_report():
+    profiler = Profiler(enabled=True)
+    for path in ("a.py", "b.py", "c.py"):
+        file_profiler = Profiler(enabled=True, path=path)
+        with file_profiler.span("parse"):
+            file_profiler.count(names=len(path), scopes=1, imports=0)
+        profiler.extend(file_profiler)
+
+    report = profiler.report(slowest=2).splitlines()
+
+    assert report[0].split() == ["phase", "calls", "wall", "ms", "cpu", "ms"]
+    assert report[1].split()[:2] == ["parse", "3"]
+    assert report[3].split() == ["wall", "ms", "cpu", "ms", "names", "scopes", "imports", "path"]
+    assert len(report) == 6
+    assert [line.split()[2:5] for line in report[4:]] == [["4", "1", "0"], ["4", "1", "0"]]
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_main_run_profile(tmp_path: Path, capsys, monkeypatch, jobs):
+    monkeypatch.setattr("unimport.main.FILES_PER_JOB", 1)
+    write_files(tmp_path, {"a.py": "import os\n", "b.py": "import sys\n\nprint(sys)  # noqa\n"})
+
+    argv = ["--disable-auto-discovery-config", "--diff", "--profile", "--profile-slowest", "1", "--jobs", jobs]
+    main = Main.run([*argv, str(tmp_path)])
+
+    assert {span.name for span in main.profiler.spans} >= {"discover", "analyze", "read", "parse", "refactor", "diff"}
+    assert set(main.profiler.counters) == {str(tmp_path / "a.py")}  # b.py is clean by its tokens
+    report = capsys.readouterr().err.split("\n\n")
+    assert len(report[1].splitlines()) == 2
+    assert (
+        report[2]
+        == "Files without imports, only checked for syntax errors: 0\nFiles clean by their tokens, not traversed: 1\n"
+    )
+
+
+def test_main_run_profile_import_free_files(tmp_path: Path, capsys):
+    write_files(tmp_path, {"a.py": "import os\n", "b.py": "from __future__ import annotations\n\nx = 1\n"})
+
+    main = Main.run(["--disable-auto-discovery-config", "--check", "--profile", "--jobs", "1", str(tmp_path)])
+
+    assert main.import_free_files == 1
+    assert [span.path for span in main.profiler.spans if span.name == "traverse"] == [str(tmp_path / "a.py")]
+    assert "Files without imports, only checked for syntax errors: 1\n" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("command", ["--check", "--diff"])
+def test_main_run_profile_refactor_import(tmp_path: Path, monkeypatch, command):
+    write_files(tmp_path, {"a.py": "import os\n", "b.py": "import sys\n"})
+    imported = []
+
+    class Finder:
+        @staticmethod
+        def find_spec(name, path, target=None):
+            if name == "unimport.refactor":
+                imported.append(time.perf_counter_ns())
+
+    monkeypatch.delitem(sys.modules, "unimport.refactor", raising=False)
+    monkeypatch.setattr(sys, "meta_path", [Finder(), *sys.meta_path])
+
+    main = Main.run(["--disable-auto-discovery-config", command, "--profile", "--jobs", "1", str(tmp_path)])
+
+    analyze_starts = [span.start for span in main.profiler.spans if span.name == "analyze"]
+    if command == "--check":
+        assert imported == []
+    else:
+        assert len(imported) == 1 and imported[0] < min(analyze_starts)
+
+
+def test_get_trace_events():
+    profiler = Profiler(enabled=True, path="a.py")
+    with profiler.span("analyze"):
+        with profiler.span("read"):
+            pass
+
+    process_name, analyze, read = profiler.get_trace_events()
+
+    assert process_name == {
+        "name": "process_name",
+        "ph": "M",
+        "pid": os.getpid(),
+        "tid": 0,
+        "args": {"name": "unimport"},
+    }
+    assert (analyze["name"], analyze["ph"], analyze["ts"], analyze["args"]["path"]) == ("analyze", "X", 0, "a.py")
+    assert read["name"] == "read"
+    assert analyze["ts"] <= read["ts"] <= read["ts"] + read["dur"] <= analyze["ts"] + analyze["dur"]
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_main_run_trace_out(tmp_path: Path, monkeypatch, jobs):
+    monkeypatch.setattr("unimport.main.FILES_PER_JOB", 1)
+    write_files(tmp_path, {"a.py": "import os\n", "b.py": "import sys\n\nprint(sys)\n"})
+    trace_out = tmp_path / "trace.json"
+
+    Main.run(
+        ["--disable-auto-discovery-config", "--check", "--trace-out", str(trace_out), "--jobs", jobs, str(tmp_path)]
+    )
+
+    events = json.loads(trace_out.read_text())["traceEvents"]
+    lanes = {(event["pid"], event["tid"]) for event in events if event["name"] == "analyze"}
+    assert {event["args"]["path"] for event in events if event["name"] == "analyze"} == {
+        str(tmp_path / "a.py"),
+        str(tmp_path / "b.py"),
+    }
+    assert {event["name"] for event in events if event["ph"] == "X"} >= {"discover", "analyze", "read", "parse"}
+    if jobs == "1":
+        assert lanes == {(os.getpid(), threading.get_ident())}
+    else:
+        assert all(pid != os.getpid() for pid, _ in lanes)
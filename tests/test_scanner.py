@@ -0,0 +1,83 @@
+import tokenize
+from textwrap import dedent
+from unittest import mock
+
+import pytest
+
+from unimport.analyzers import MainAnalyzer
+from unimport.scanner import is_clean
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "import os\n\nos.getcwd()\n",
+        "import os.path as osp\nfrom typing import (\n    List,\n    Optional as O,\n)\n\nx: List[O[osp.sep]]\n",
+        "from __future__ import annotations\nfrom . import x\n\nprint(x)\n",
+        "import sys\n\n\ndef f(a, *, b=sys.argv, **kwargs):\n    return lambda c: c\n",
+        "import re\n\n\nclass A(re.Pattern, metaclass=type):\n    pass\n",
+        "import json\n\nprint(json.dumps({}), end='')\n",
+    ],
+)
+def test_is_clean(source):
+    assert is_clean(source) is True
+    with MainAnalyzer(source=source) as analyzer:
+        assert list(analyzer.session.get_unused_imports()) == []
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "import os\n",
+        "os.getcwd()\nimport os\n",
+        "import os\n\nx.os\n",
+        "import os\n\nprint(os='a')\n",
+        "import os\n\n\ndef f(a, os):\n    pass\n",
+        "import os\n\nf = lambda a, os: 1\n",
+        "import os\n\n\ndef os():\n    pass\n",
+        "import os\n\ntry:\n    pass\nexcept Exception as os:\n    pass\n",
+        "import os\n\n\ndef f():\n    global os\n",
+        "import os\nimport os.path\n\nos.path.join()\n",
+        "from os import *\n\ngetcwd()\n",
+        "import os\n\n__all__ = ['os']\n",
+        "import os\nfrom typing import TYPE_CHECKING\n\nos, TYPE_CHECKING\n",
+        "try:\n    import os\nexcept ImportError:\n    os = None\n",
+        "import os\n\nmatch x:\n    case os:\n        pass\n",
+        "import os\n\n'''os'''  # os\n",
+        "import os\n\nx = (\n",
+    ],
+)
+def test_is_not_clean(source):
+    assert is_clean(source) is False
+
+
+def test_quick_reject_skips_the_traversal():
+    source = dedent(
+        """\
+        import os
+
+        os.getcwd()  # noqa
+        """
+    )
+    with MainAnalyzer(source=source, quick_reject=True) as analyzer:
+        assert analyzer.is_clean is True
+        assert analyzer.session.names == analyzer.session.imports == []
+
+    with pytest.raises(SyntaxError):
+        MainAnalyzer(source="import os\nos.getcwd(  # noqa\n", quick_reject=True).traverse()
+
+
+def test_quick_reject_only_tokenizes_sources_with_skip_comments(monkeypatch):
+    generate_tokens = mock.Mock(wraps=tokenize.generate_tokens)
+    monkeypatch.setattr(tokenize, "generate_tokens", generate_tokens)
+
+    with MainAnalyzer(source="import os\n\nos.getcwd()\n", quick_reject=True) as analyzer:
+        assert analyzer.is_clean is False
+        assert [imp.name for imp in analyzer.session.imports] == ["os"]
+    assert generate_tokens.call_count == 0
+
+    # The tokens are shared by the scanner and the skip comments.
+    with MainAnalyzer(source="import os  # noqa\nimport sys\n", quick_reject=True) as analyzer:
+        assert analyzer.is_clean is False
+        assert [imp.name for imp in analyzer.session.get_unused_imports()] == ["sys"]
+    assert generate_tokens.call_count == 1
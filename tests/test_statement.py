@@ -0,0 +1,59 @@
+import ast
+import pickle
+
+import pytest
+
+from unimport.analyzers import MainAnalyzer
+from unimport.statement import ImportTrie, NameTable, Scope
+
+
+@pytest.mark.parametrize(
+    "name, exclude, expected",
+    [
+        ("a.b.c.x", "a.b.c", True),
+        ("a.b.x", "a.b", False),
+        ("a.b.c", "a.b", True),
+        ("a.d.x", "a.b", True),
+        ("a.e", "a.b", False),
+        ("a", "a.b", False),
+    ],
+)
+def test_import_trie_has_prefix(name, exclude, expected):
+    trie = ImportTrie()
+    for import_name in ("a.b", "a.b.c", "a.d"):
+        trie.add(import_name.split("."))
+
+    assert trie.has_prefix(name.split("."), exclude=exclude.split(".")) is expected
+
+
+def test_import_trie_counts_duplicate_imports():
+    trie = ImportTrie()
+    trie.add(("a", "b"))
+    trie.add(("a", "b"))
+
+    assert trie.has_prefix(("a", "b", "x"), exclude=("a", "b")) is True
+
+
+def test_detached_import_drops_analysis_references():
+    with MainAnalyzer(source="import os.path\n") as analyzer:
+        imp = analyzer.session.imports[0]
+        detached = imp.detach()
+
+    assert detached == imp
+    assert detached.parts == ("os", "path")
+    assert not any(hasattr(detached, name) for name in ("node", "session", "scope"))
+    assert pickle.loads(pickle.dumps(imp)) == imp
+
+
+def test_name_table_interns_names_and_scopes():
+    scope = Scope(ast.parse("a.b\na\n"))
+    table = NameTable()
+    table.add(1, "a.b", scope)
+    table.add(1, "a", scope)
+    table.add(2, "a", scope)
+
+    assert len(table) == 3
+    assert table.symbols == ["a.b", "a"]
+    assert table.scopes == [scope]
+    assert list(table.symbol_column) == [0, 1, 1]
+    assert list(table.rows({1})) == [(1, "a", scope), (2, "a", scope)]
@@ -1,12 +1,15 @@
 import os
+import shutil
 import sys
-import textwrap
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
-from tests.utils import refactor, reopenable_temp_file
+from tests.utils import git, refactor, reopenable_temp_file, write_files
 from unimport import utils
+from unimport.exceptions import GitCommandError
+from unimport.gitignore import Gitignore
 from unimport.utils import action_to_bool
 
 
@@ -28,24 +31,37 @@ def test_list_paths(path, count):
     assert len(list(utils.list_paths(path))) == count
 
 
-@pytest.mark.skipif(
-    sys.platform == "win32",
-    reason="Patspec version 0.10.1 and above are not supported on Windows",
-)
-def test_list_paths_with_gitignore():
-    gitignore = textwrap.dedent(
-        """\
-        a
-        b
-        spam/**
-        **/api/
-        **/tests
-        **/
-        """
+def test_list_paths_prunes_excluded_directories(tmp_path: Path, monkeypatch):
+    write_files(
+        tmp_path,
+        {"a.py": "", "pkg/b.py": "", "pkg/c.txt": "", ".venv/lib/d.py": "", "build/e.py": "", "docs.py/f.py": ""},
     )
-    with reopenable_temp_file(gitignore) as gitignore_path:
-        gitignore_patterns = utils.get_exclude_list_from_gitignore(gitignore_path)
-        assert list(utils.list_paths(Path("."), gitignore_patterns=gitignore_patterns)) == []
+    scanned = []
+    scandir = os.scandir
+
+    def recording_scandir(path):
+        scanned.append(Path(path))
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", recording_scandir)
+    write_files(tmp_path, {".gitignore": "build/"})
+    paths = utils.list_paths(tmp_path, exclude=r"\.venv", gitignore=Gitignore(str(tmp_path)))
+
+    assert sorted(path.relative_to(tmp_path) for path in paths) == [
+        Path("a.py"),
+        Path("docs.py/f.py"),
+        Path("pkg/b.py"),
+    ]
+    assert tmp_path / ".venv" not in scanned
+    assert tmp_path / "build" not in scanned
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Symlinks require privileges on Windows")
+def test_list_paths_symlink_loop(tmp_path: Path):
+    write_files(tmp_path, {"pkg/a.py": ""})
+    (tmp_path / "pkg" / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+    assert list(utils.list_paths(tmp_path)) == [tmp_path / "pkg" / "a.py"]
 
 
 def test_bad_encoding():
@@ -141,6 +157,27 @@ def test_return_exit_code(
     )
 
 
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("", False),
+        ("x = 1\n", False),
+        ("from __future__ import annotations\n\nx = 1\n", False),
+        ('"""import os"""\n# import sys\nimportant = 1\n', False),
+        ("import os\n", True),
+        ("from __future__ import annotations\nfrom . import x\n", True),
+        ("if x: import os\n", True),
+        ("x = (\n'import'\n", True),
+    ],
+)
+def test_has_imports(source, expected):
+    assert utils.has_imports(source) is expected
+
+
+def test_cpu_count():
+    assert 1 <= utils.cpu_count() <= (os.cpu_count() or 1)
+
+
 def test_action_to_bool():
     yes = ("y", "Y", "yes", "True", "t", "true", "True", "On", "on", "1")
     no = ("n", "no", "f", "false", "off", "0", "Off", "No", "N")
@@ -150,3 +187,56 @@ def test_action_to_bool():
 
     for n in no:
         assert action_to_bool(n) is False
+
+
+@pytest.mark.parametrize(
+    "chunks, expected",
+    [
+        ([b"a.py", b"\0b.py\n", b"c.py\0"], [Path("a.py"), Path("b.py\nc.py")]),
+        ([b"a.py", b"\nb.py\n"], [Path("a.py"), Path("b.py")]),
+        ([b"a.py"], [Path("a.py")]),
+    ],
+)
+def test_read_paths_in_chunks(chunks: list[bytes], expected: list[Path]):
+    stream = mock.Mock()
+    stream.read1.side_effect = [*chunks, b""]
+
+    assert list(utils.read_paths(stream)) == expected
+
+
+def test_get_changed_paths(git_repository: Path):
+    write_files(git_repository, {"a.py": "", "b.py": "", "c.py": "", "pkg/d.py": "", "README.md": ""})
+    git("add", ".")
+    git("commit", "-q", "-m", "initial")
+
+    write_files(git_repository, {"a.py": "import os", "pkg/d.py": "import os", "e.py": "", "README.md": "readme"})
+    git("add", "pkg/d.py")
+    (git_repository / "b.py").unlink()
+
+    assert sorted(utils.get_changed_paths("HEAD")) == [Path("a.py"), Path("e.py"), Path("pkg/d.py")]
+
+    os.chdir(git_repository / "pkg")
+    assert utils.get_changed_paths("HEAD") == [Path("d.py")]
+
+
+def test_get_changed_paths_unknown_ref(git_repository: Path):
+    with pytest.raises(GitCommandError, match="unknown commit 'there-is-no-such-ref'"):
+        utils.get_changed_paths("there-is-no-such-ref")
+
+
+def test_get_changed_paths_outside_work_tree(git_repository: Path, monkeypatch):
+    shutil.rmtree(git_repository / ".git")  # git is installed, but this is not a work tree
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(git_repository.parent))
+
+    with pytest.raises(GitCommandError) as exc_info:
+        utils.get_changed_paths("HEAD")
+
+    assert "not a git repository" in str(exc_info.value)
+    assert "\n" not in str(exc_info.value)
+
+
+def test_get_changed_paths_rejects_option_like_ref(git_repository: Path):
+    with pytest.raises(GitCommandError, match="a ref cannot start with '-'"):
+        utils.get_changed_paths("--output=changed.txt")
+
+    assert not (git_repository / "changed.txt").exists()
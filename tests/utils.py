@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import subprocess
 import tempfile
 import typing
 from contextlib import contextmanager
@@ -9,7 +10,6 @@ from pathlib import Path
 from unimport import utils
 from unimport.analyzers import MainAnalyzer
 from unimport.refactor import refactor_string
-from unimport.statement import Import
 
 
 @contextmanager
@@ -45,5 +45,16 @@ def refactor(path: Path) -> str:
     with MainAnalyzer(source=source) as analyzer:
         return refactor_string(
             source=analyzer.source,
-            unused_imports=list(Import.get_unused_imports()),
+            unused_imports=list(analyzer.session.get_unused_imports()),
         )
+
+
+def git(*args: str) -> None:
+    subprocess.run(["git", *args], check=True, capture_output=True)
+
+
+def write_files(root: Path, files: dict[str, str]) -> None:
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)